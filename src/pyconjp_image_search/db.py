@@ -1,18 +1,50 @@
 """Shared DuckDB connection factory."""
 
+import queue
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 import duckdb
 
 from pyconjp_image_search.config import DB_PATH
 
 
 def get_connection(
-    db_path: str | None = None, embedding_dim: int = 768
+    db_path: str | None = None, embedding_dim: int = 768, read_only: bool = False
 ) -> duckdb.DuckDBPyConnection:
-    """Open a DuckDB connection. Defaults to the project-root DB file."""
-    path = db_path or str(DB_PATH)
-    conn = duckdb.connect(path)
+    """Open a DuckDB connection. Defaults to the project-root DB file.
 
-    from pyconjp_image_search.manager.schema import ensure_schema
+    Read-only connections skip schema setup (they cannot write) and avoid
+    write-lock/WAL bookkeeping, so pure readers like the search app should
+    prefer them.
+    """
+    path = db_path or str(DB_PATH)
+    conn = duckdb.connect(path, read_only=read_only)
+    if not read_only:
+        from pyconjp_image_search.manager.schema import ensure_schema
 
-    ensure_schema(conn, embedding_dim=embedding_dim)
+        ensure_schema(conn, embedding_dim=embedding_dim)
     return conn
+
+
+class CursorPool:
+    """Fixed-size pool of DuckDB cursors over one parent connection.
+
+    Each cursor is an independent connection to the same database, so
+    concurrent read queries run in parallel instead of serializing on the
+    parent connection's internal lock. Callers check a cursor out for the
+    duration of one query batch via `acquire`.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection, size: int = 4) -> None:
+        self._cursors: queue.Queue[duckdb.DuckDBPyConnection] = queue.Queue(maxsize=size)
+        for _ in range(size):
+            self._cursors.put(conn.cursor())
+
+    @contextmanager
+    def acquire(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        cursor = self._cursors.get()
+        try:
+            yield cursor
+        finally:
+            self._cursors.put(cursor)
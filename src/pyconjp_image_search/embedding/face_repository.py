@@ -99,6 +99,30 @@ def get_face_stats(
     return total, processed, faces
 
 
+# The face-similarity SQL comes in exactly two shapes: with and without the
+# event filter. Building them once (the filter takes the event list as a
+# single VARCHAR[] parameter instead of a variable-length IN list) keeps the
+# statement text stable across calls, so DuckDB re-parses/re-plans the same
+# string instead of a fresh one per event selection.
+_FACE_SEARCH_SQL = """
+    SELECT f.face_id, f.image_id, f.model_name,
+           f.bbox_x1, f.bbox_y1, f.bbox_x2, f.bbox_y2,
+           f.det_score, f.landmark, f.age, f.gender,
+           f.embedding, f.person_label, f.cluster_id,
+           i.*,
+           list_dot_product(f.embedding, ?::FLOAT[512]) AS score
+    FROM face_detections f
+    JOIN images i ON i.id = f.image_id
+    WHERE f.model_name = ?{event_filter}
+    ORDER BY score DESC
+    LIMIT ?
+"""
+_FACE_SEARCH_ALL = _FACE_SEARCH_SQL.format(event_filter="")
+_FACE_SEARCH_FILTERED = _FACE_SEARCH_SQL.format(
+    event_filter=" AND list_contains(?::VARCHAR[], i.event_name)"
+)
+
+
 def search_faces_by_embedding(
     conn: duckdb.DuckDBPyConnection,
     query_embedding: np.ndarray,
@@ -106,35 +130,21 @@ def search_faces_by_embedding(
     limit: int = 20,
     event_names: list[str] | None = None,
 ) -> list[tuple[FaceDetection, ImageMetadata, float]]:
-    """Search faces by cosine similarity to a query embedding."""
-    query_vec = query_embedding.flatten().tolist()
-    params: list = [query_vec, model_name]
+    """Search faces by cosine similarity to a query embedding.
 
-    where_clauses = ["f.model_name = ?"]
+    Stored detections carry InsightFace's unit-norm embedding and the query
+    is normalized here, so the SQL dot product is the cosine similarity.
+    """
+    query_vec = query_embedding.astype(np.float32, copy=False).ravel()
+    query_vec = (query_vec / max(float(np.linalg.norm(query_vec)), 1e-8)).tolist()
     if event_names:
-        placeholders = ", ".join(["?"] * len(event_names))
-        where_clauses.append(f"i.event_name IN ({placeholders})")
-        params.extend(event_names)
-
-    where_sql = " AND ".join(where_clauses)
-    params.append(limit)
+        sql = _FACE_SEARCH_FILTERED
+        params = [query_vec, model_name, event_names, limit]
+    else:
+        sql = _FACE_SEARCH_ALL
+        params = [query_vec, model_name, limit]
 
-    rows = conn.execute(
-        f"""
-        SELECT f.face_id, f.image_id, f.model_name,
-               f.bbox_x1, f.bbox_y1, f.bbox_x2, f.bbox_y2,
-               f.det_score, f.landmark, f.age, f.gender,
-               f.embedding, f.person_label, f.cluster_id,
-               i.*,
-               list_cosine_similarity(f.embedding, ?::FLOAT[512]) AS score
-        FROM face_detections f
-        JOIN images i ON i.id = f.image_id
-        WHERE {where_sql}
-        ORDER BY score DESC
-        LIMIT ?
-        """,
-        params,
-    ).fetchall()
+    rows = conn.execute(sql, params).fetchall()
 
     results = []
     for row in rows:
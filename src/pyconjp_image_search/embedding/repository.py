@@ -13,7 +13,14 @@ def insert_embeddings(
     embeddings: np.ndarray,
     model_name: str,
 ) -> None:
-    """Batch insert embeddings. Skips on conflict (idempotent)."""
+    """Batch insert embeddings. Skips on conflict (idempotent).
+
+    Rows are stored unit-normalized (the embedders already emit unit vectors;
+    this guarantees it) so similarity queries can use a plain dot product
+    instead of recomputing per-row norms on every scan.
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = embeddings / np.clip(norms, a_min=1e-8, a_max=None)
     for i, image_id in enumerate(image_ids):
         vec = embeddings[i].tolist()
         conn.execute(
@@ -83,13 +90,23 @@ def search_by_embedding(
     query_embedding: np.ndarray,
     model_name: str,
     limit: int = 20,
-    embedding_dim: int = 768,
+    embedding_dim: int | None = None,
 ) -> list[tuple[ImageMetadata, float]]:
-    """Search images by cosine similarity to query embedding."""
-    query_vec = query_embedding.flatten().tolist()
+    """Search images by cosine similarity to query embedding.
+
+    Stored rows are unit-norm (see insert_embeddings) and the query is
+    normalized here, so the dot product *is* the cosine similarity without
+    the per-row sqrt/sum that list_cosine_similarity recomputes. The cast
+    dimension defaults to the query's own width, which must match the
+    schema's embedding column.
+    """
+    query_vec = query_embedding.astype(np.float32, copy=False).ravel()
+    if embedding_dim is None:
+        embedding_dim = query_vec.size
+    query_vec = (query_vec / max(float(np.linalg.norm(query_vec)), 1e-8)).tolist()
     rows = conn.execute(
         f"""
-        SELECT i.*, list_cosine_similarity(e.embedding, ?::FLOAT[{embedding_dim}]) AS score
+        SELECT i.*, list_dot_product(e.embedding, ?::FLOAT[{embedding_dim}]) AS score
         FROM image_embeddings e
         JOIN images i ON i.id = e.image_id
         WHERE e.model_name = ?
@@ -1,45 +1,79 @@
 """CRUD operations for image metadata in DuckDB."""
 
+from dataclasses import fields
+
 import duckdb
 
 from pyconjp_image_search.models import ImageMetadata
 
+_IMAGE_COLUMNS = (
+    "image_url, relative_path, local_filename, "
+    "flickr_photo_id, album_id, album_title, "
+    "event_name, event_year, event_type, "
+    "image_format, width, height, file_size_bytes, downloaded_at"
+)
+
+_IMAGE_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+_INSERT_IMAGE_SQL = (
+    f"INSERT INTO images ({_IMAGE_COLUMNS}) VALUES {_IMAGE_ROW} ON CONFLICT (image_url) DO NOTHING"
+)
+
+_INSERT_EVENT_SQL = (
+    "INSERT INTO events (event_name, event_year) VALUES (?, ?) ON CONFLICT DO NOTHING"
+)
+
+
+def _insert_params(meta: ImageMetadata) -> list:
+    """Parameter list for _INSERT_IMAGE_SQL, in column order."""
+    return [
+        meta.image_url,
+        meta.relative_path,
+        meta.local_filename,
+        meta.flickr_photo_id,
+        meta.album_id,
+        meta.album_title,
+        meta.event_name,
+        meta.event_year,
+        meta.event_type,
+        meta.image_format,
+        meta.width,
+        meta.height,
+        meta.file_size_bytes,
+        meta.downloaded_at,
+    ]
+
 
 def insert_image(conn: duckdb.DuckDBPyConnection, meta: ImageMetadata) -> None:
     """Insert a single image metadata record. Skip on URL conflict."""
-    conn.execute(
-        """
-        INSERT INTO images (
-            image_url, relative_path, local_filename,
-            flickr_photo_id, album_id, album_title,
-            event_name, event_year, event_type,
-            image_format, width, height, file_size_bytes, downloaded_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT (image_url) DO NOTHING
-        """,
-        [
-            meta.image_url,
-            meta.relative_path,
-            meta.local_filename,
-            meta.flickr_photo_id,
-            meta.album_id,
-            meta.album_title,
-            meta.event_name,
-            meta.event_year,
-            meta.event_type,
-            meta.image_format,
-            meta.width,
-            meta.height,
-            meta.file_size_bytes,
-            meta.downloaded_at,
-        ],
-    )
+    conn.execute(_INSERT_IMAGE_SQL, _insert_params(meta))
+    # Keep the events reference table current so event lookups never need a
+    # DISTINCT scan over images.
+    conn.execute(_INSERT_EVENT_SQL, [meta.event_name, meta.event_year])
 
 
-def insert_images(conn: duckdb.DuckDBPyConnection, metadata_list: list[ImageMetadata]) -> None:
-    """Bulk insert image metadata records."""
-    for meta in metadata_list:
-        insert_image(conn, meta)
+def insert_images(
+    conn: duckdb.DuckDBPyConnection, metadata_list: list[ImageMetadata]
+) -> list[int]:
+    """Bulk insert image metadata records and return the generated ids.
+
+    One multi-row VALUES statement keeps the batch on DuckDB's vectorized
+    write path, and RETURNING hands the new ids back from the write itself
+    instead of a follow-up scan. Ids come back in input order; rows skipped
+    by the URL conflict are absent from the returned list.
+    """
+    if not metadata_list:
+        return []
+    values = ", ".join([_IMAGE_ROW] * len(metadata_list))
+    params = [param for meta in metadata_list for param in _insert_params(meta)]
+    rows = conn.execute(
+        f"INSERT INTO images ({_IMAGE_COLUMNS}) VALUES {values} "
+        "ON CONFLICT (image_url) DO NOTHING RETURNING id",
+        params,
+    ).fetchall()
+    events = {(meta.event_name, meta.event_year) for meta in metadata_list}
+    conn.executemany(_INSERT_EVENT_SQL, [list(pair) for pair in sorted(events)])
+    return [row[0] for row in rows]
 
 
 def get_existing_photo_ids(
@@ -114,3 +148,22 @@ def _row_to_metadata(row: tuple) -> ImageMetadata:
         downloaded_at=row[14],
         created_at=row[15],
     )
+
+
+# ImageMetadata declares its fields in exactly the images-table column order
+# documented above, so a row zips straight onto the field names.
+_METADATA_FIELDS = tuple(f.name for f in fields(ImageMetadata))
+
+
+def _row_to_metadata_fast(row: tuple) -> ImageMetadata:
+    """Convert a DB row to ImageMetadata, skipping __init__ dispatch.
+
+    Bulk converters (the in-memory matrix build turns every image row into a
+    dataclass at once) spend most of their time in the generated __init__'s
+    argument handling; writing the fields into __dict__ directly produces an
+    identical instance severalfold faster. Single-row paths keep the explicit
+    keyword constructor above for readability.
+    """
+    meta = ImageMetadata.__new__(ImageMetadata)
+    meta.__dict__.update(zip(_METADATA_FIELDS, row))
+    return meta
@@ -29,6 +29,16 @@ def ensure_schema(conn: duckdb.DuckDBPyConnection, embedding_dim: int = 768) ->
     conn.execute("CREATE INDEX IF NOT EXISTS idx_images_event ON images(event_name, event_year)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_images_album ON images(album_id)")
 
+    # Tiny reference table for the event vocabulary, maintained by the image
+    # insert path. Event lookups read its handful of rows instead of running
+    # a DISTINCT aggregate over every image.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            event_name VARCHAR PRIMARY KEY,
+            event_year INTEGER
+        )
+    """)
+
     # image_embeddings table
     conn.execute(f"""
         CREATE TABLE IF NOT EXISTS image_embeddings (
@@ -129,3 +139,10 @@ def _migrate(conn: duckdb.DuckDBPyConnection) -> None:
     conn.execute(
         "CREATE UNIQUE INDEX IF NOT EXISTS idx_images_flickr_photo_id ON images(flickr_photo_id)"
     )
+    # Backfill the events reference table for databases ingested before it
+    # existed; subsequent inserts keep it current.
+    conn.execute("""
+        INSERT INTO events (event_name, event_year)
+        SELECT event_name, MAX(event_year) FROM images GROUP BY event_name
+        ON CONFLICT DO NOTHING
+    """)
@@ -1,12 +1,21 @@
 """Gradio application for image search UI."""
 
+import asyncio
+import base64
+import hashlib
 import json
 import re
 import tempfile
+import threading
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
+from typing import NamedTuple
 
+import duckdb
 import gradio as gr
 import numpy as np
 from PIL import Image
@@ -14,6 +23,7 @@ from PIL import Image
 from pyconjp_image_search.config import (
     CLIP_DB_PATH,
     CLIP_MODEL_NAME,
+    DB_PATH,
     FLICKR_USER_ID,
     INSIGHTFACE_MODEL_NAME,
     SIGLIP_LARGE_DB_PATH,
@@ -21,29 +31,155 @@ from pyconjp_image_search.config import (
     SIGLIP_LARGE_MODEL_NAME,
     SIGLIP_MODEL_NAME,
 )
-from pyconjp_image_search.db import get_connection
+from pyconjp_image_search.db import CursorPool, get_connection
 from pyconjp_image_search.embedding.face_repository import (
     get_faces_for_image,
     search_faces_by_embedding,
 )
 from pyconjp_image_search.models import FaceDetection, ImageMetadata
+from pyconjp_image_search.search.embed_cache import LRUEmbeddingCache
 from pyconjp_image_search.search.query import (
     get_event_names,
     get_image_embedding,
     search_images_by_text,
 )
+from pyconjp_image_search.search.singleflight import SingleFlight
 
 PAGE_SIZE = 20
 
+# Ceiling on the accumulated Load-More gallery: beyond this the oldest tiles
+# are dropped, so session memory and the per-click serializer payload stay
+# bounded no matter how long a user paginates.
+MAX_GALLERY = 500
+
+# Shared visibility sentinels; handlers toggle visibility constantly, so one
+# frozen update object each avoids a dict allocation per toggle.
+_HIDE = gr.update(visible=False)
+_SHOW = gr.update(visible=True)
+_HIDE_NONE = gr.update(value=None, visible=False)
+_HIDE_EMPTY = gr.update(value="", visible=False)
+
+# Close-preview payload, ordered like _SearchTab.close_outputs. Static, so
+# close clicks, tab switches and the merged search handlers all share the
+# same tuple.
+_CLOSE_UPDATES = (
+    _HIDE_NONE,  # preview image
+    _HIDE_EMPTY,  # preview caption
+    _HIDE_NONE,  # thumb strip
+    _HIDE,  # close btn
+    _HIDE,  # find similar btn
+    _HIDE,  # search cropped btn
+    _HIDE,  # copy clipboard btn
+    _HIDE_NONE,  # face gallery
+    [],  # face detections
+)
+_TAB_SWITCH_UPDATES = _CLOSE_UPDATES + _CLOSE_UPDATES  # both tabs
+
+# First streamed update from the search handlers: flip the info line so the
+# click registers on screen while the embed + ranking still run. Arity is
+# _SearchTab.search_outputs (8, info at index 1) plus close_outputs (9); the
+# image handler adds the face-state pair. Everything but the info line is a
+# no-op update.
+_NOOP = gr.update()
+_SEARCHING_TEXT = (_NOOP, "Searching...") + (_NOOP,) * 15
+_SEARCHING_IMAGE = (_NOOP, "Searching...") + (_NOOP,) * 17
+
+
+def _on_close_preview() -> tuple:
+    return _CLOSE_UPDATES
+
+
+def _on_tab_switch() -> tuple:
+    return _TAB_SWITCH_UPDATES
+
+
+# Prebuilt failed-precondition payloads for the search handlers. Gradio only
+# reads these, so sharing the empty lists between invocations is safe.
+_EMPTY_TEXT_SEARCH = ([], "Please enter a search query.", 0, None, [], [], None, _HIDE)
+_EMPTY_IMAGE_SEARCH = ([], "Please upload an image.", 0, None, [], [], None, _HIDE)
+
+# Text query embeddings keyed by (model_name, normalized query). Repeated
+# queries skip the model forward pass entirely.
+_text_embed_cache = LRUEmbeddingCache(capacity=1024, ttl=3600)
+
+# Perennial conference queries, embedded during warm-up so even a first-time
+# search for them is a cache hit. Must be lowercase: cache keys use the
+# normalized (lowercased) query string.
+_WARMUP_QUERIES = ("keynote", "lightning talk", "sponsor booth", "party")
+
+# Crop-region embeddings (plus the rendered crop file) keyed by model and the
+# exact URL/rectangle. Re-running the same crop skips the Flickr download,
+# JPEG decode and vision forward pass.
+_crop_embed_cache = LRUEmbeddingCache[tuple[np.ndarray, Path]](capacity=256, ttl=3600)
+
+# Uploaded-image embeddings keyed by model and content hash. Gradio writes a
+# fresh temp file per upload, so the path is useless as a key, but re-running
+# a search with the same picture (e.g. after toggling the event filter) is a
+# byte-identical file and skips the vision forward pass.
+_upload_embed_cache = LRUEmbeddingCache(capacity=64, ttl=3600)
+
+
+def _embed_upload(embedder, model_name: str, image_path: str) -> np.ndarray:
+    """Embed an uploaded image, reusing the embedding for identical bytes."""
+    data = Path(image_path).read_bytes()
+    key = (model_name, hashlib.sha1(data).hexdigest())
+    emb = _upload_embed_cache.get(key)
+    if emb is None:
+        emb = embedder.embed_pil([Image.open(BytesIO(data))])
+        _upload_embed_cache.put(key, emb)
+    return emb
+
+
+# Pool for speculative fetches of the next result page while the user is
+# looking at the current one.
+_prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+# Concurrent identical searches (two tabs, bursty duplicate queries) collapse
+# into one ranking pass; followers wait for the owner's result.
+_search_flight = SingleFlight()
+
+# Separate executors for the async handlers: embedder forward passes and DB
+# ranking can overlap instead of blocking each other (and the event loop).
+# The embedder pool is single-threaded because the torch models are not
+# re-entrant.
+_embed_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embed")
+_db_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db")
+
+
+def _emb_to_state(embedding: np.ndarray) -> np.ndarray:
+    """Shape a query embedding for gr.State.
+
+    gr.State holds arbitrary Python objects per session, so the float32 array
+    is stored as-is — no serialization, no dtype round-trip — and Load More
+    ranks against exactly the vector the first page used.
+    """
+    return embedding.astype(np.float32, copy=False).ravel()
+
+
+def _prefetch_key(
+    model_name: str, selected_events: list[str], offset: int, query_emb: np.ndarray
+) -> tuple:
+    """Identify a result page so a stale prefetch is never served."""
+    digest = hashlib.sha1(np.ascontiguousarray(query_emb).tobytes()).hexdigest()
+    return (model_name, tuple(selected_events or ()), offset, digest)
+
+
 # Flickr static URL size suffix pattern: {id}_{secret}_{size}.jpg
 _FLICKR_SIZE_RE = re.compile(r"(_[a-z0-9])\.jpg$", re.IGNORECASE)
 
+# Photo-page URL prefix, built once; None when no user id is configured.
+_FLICKR_BASE = f"https://www.flickr.com/photos/{FLICKR_USER_ID}/" if FLICKR_USER_ID else None
+
 
 def _flickr_url_resize(url: str, size: str = "z") -> str:
     """Swap the size suffix in a Flickr static URL.
 
     Size suffixes: s=75sq, q=150sq, t=100, m=240, z=640, b=1024, h=1600, k=2048
     """
+    # Every Flickr static URL ends in "_<size>.jpg", so the common case is a
+    # plain string slice; the regex stays as the fallback for odd inputs.
+    if url.endswith(".jpg") and len(url) >= 6 and url[-6] == "_":
+        return url[:-6] + f"_{size}.jpg"
     return _FLICKR_SIZE_RE.sub(f"_{size}.jpg", url)
 
 
@@ -55,10 +191,12 @@ def _make_face_crops(
     """Download image and crop each face region using PIL."""
     if not faces:
         return []
-    # Download the original-size image from Flickr
+    # Download the original-size image from Flickr. PIL reads straight from
+    # the response (buffering internally only if it must seek), and the
+    # context manager closes the socket as soon as decoding is done.
     url = _flickr_url_resize(image_url, "b")  # 1024px
-    response = urllib.request.urlopen(url)  # noqa: S310
-    img = Image.open(BytesIO(response.read())).convert("RGB")
+    with urllib.request.urlopen(url) as response:  # noqa: S310
+        img = Image.open(response).convert("RGB")
     actual_w, actual_h = img.size
 
     # Compute scale factor: bbox coords are in original image pixels
@@ -81,220 +219,53 @@ def _make_face_crops(
         x2 = min(actual_w, x2 + pad_x)
         y2 = min(actual_h, y2 + pad_y)
         cropped = img.crop((x1, y1, x2, y2))
-        tmp = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
-        cropped.save(tmp, format="JPEG", quality=85)
-        tmp.close()
+        # Encode in memory as a data URL; avoids a tempfile write + read-back
+        # per face (and the leak of delete=False temp files).
+        buf = BytesIO()
+        cropped.save(buf, format="JPEG", quality=85)
+        url = "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode()
         caption = f"Face {i + 1} (score: {face.det_score:.2f})"
-        items.append((tmp.name, caption))
+        items.append((url, caption))
     return items
 
 
-CUSTOM_CSS = """
-.full-height-gallery .grid-wrap {
-    overflow-y: visible !important;
-    max-height: none !important;
-}
-.full-height-gallery .fixed-height {
-    max-height: none !important;
-    min-height: none !important;
-}
-.full-height-gallery .grid-container {
-    grid-template-rows: none !important;
-}
-.thumb-strip .grid-wrap {
-    overflow-x: auto !important;
-    overflow-y: hidden !important;
-    max-height: 120px !important;
-}
-.thumb-strip .grid-container {
-    grid-template-rows: 1fr !important;
-    grid-auto-flow: column !important;
-    grid-auto-columns: 100px !important;
-    grid-template-columns: none !important;
-}
-/* Crop selection overlay */
-.crop-selection {
-    position: absolute;
-    border: 2px dashed rgba(255,255,255,0.9);
-    background: rgba(255,255,255,0.05);
-    pointer-events: none;
-    z-index: 10;
-    box-shadow: 0 0 0 9999px rgba(0,0,0,0.45);
-}
-.crop-overlay {
-    position: absolute;
-    top: 0; left: 0; right: 0; bottom: 0;
-    cursor: crosshair;
-    z-index: 9;
-}
-"""
-
-# ── Crop tool JS (injected once via gr.HTML) ─────────────────────────
-CROP_TOOL_SCRIPT = """
-<script>
-window._cropStates = {};
-
-window._toast = function(msg, ok) {
-    var t = document.createElement('div');
-    t.textContent = msg;
-    t.style.cssText = 'position:fixed;top:20px;left:50%;transform:translateX(-50%);'
-        + 'background:' + (ok ? '#333' : '#c00') + ';color:#fff;padding:12px 24px;'
-        + 'border-radius:8px;z-index:9999;font-size:14px;box-shadow:0 2px 8px rgba(0,0,0,.3);';
-    document.body.appendChild(t);
-    setTimeout(function(){ t.remove(); }, 2000);
-};
-
-/* Compute the actual rendered image rect inside an object-fit:contain element */
-function _getRenderedRect(img) {
-    var ir = img.getBoundingClientRect();
-    var natW = img.naturalWidth;
-    var natH = img.naturalHeight;
-    if (!natW || !natH) return ir;
-    var style = window.getComputedStyle(img);
-    var fit = style.objectFit || 'fill';
-    if (fit === 'contain' || fit === 'scale-down') {
-        var ratio = Math.min(ir.width / natW, ir.height / natH);
-        var rw = natW * ratio;
-        var rh = natH * ratio;
-        return {
-            left: ir.left + (ir.width - rw) / 2,
-            top: ir.top + (ir.height - rh) / 2,
-            width: rw,
-            height: rh
-        };
-    }
-    return { left: ir.left, top: ir.top, width: ir.width, height: ir.height };
-}
-
-/* Enable / disable the crop-dependent buttons */
-function _setCropBtns(containerId, enabled) {
-    var prefix = (containerId === 'text-preview') ? 'text' : 'img';
-    ['search-cropped-btn', 'copy-clipboard-btn'].forEach(function(suffix) {
-        var el = document.getElementById(prefix + '-' + suffix);
-        if (!el) return;
-        /* Gradio 6: elem_id may be on the <button> itself or on a wrapper */
-        var btn = (el.tagName === 'BUTTON') ? el : el.querySelector('button');
-        if (!btn) btn = el;
-        btn.disabled = !enabled;
-        btn.style.opacity = enabled ? '' : '0.4';
-        btn.style.pointerEvents = enabled ? '' : 'none';
-    });
-}
-
-/* Set up the rectangle-selection overlay on the preview image */
-function _setupOverlay(container, img, containerId) {
-    var wrapper = img.parentElement;
-    if (!wrapper) return;
-    wrapper.style.position = 'relative';
-
-    var overlay = document.createElement('div');
-    overlay.className = 'crop-overlay';
-    var sel = document.createElement('div');
-    sel.className = 'crop-selection';
-    sel.style.display = 'none';
-    wrapper.appendChild(overlay);
-    wrapper.appendChild(sel);
-
-    var st = {active:false, sx:0, sy:0, ex:0, ey:0, has:false};
-    window._cropStates[containerId] = st;
-
-    /* Disable buttons until a rectangle is drawn */
-    _setCropBtns(containerId, false);
-
-    overlay.addEventListener('mousedown', function(e) {
-        e.preventDefault();
-        var rr = _getRenderedRect(img);
-        var x = e.clientX - rr.left;
-        var y = e.clientY - rr.top;
-        if (x < 0 || y < 0 || x > rr.width || y > rr.height) return;
-        st.active = true;
-        st.sx = x; st.sy = y; st.ex = x; st.ey = y;
-        st.has = false;
-        sel.style.display = 'block';
-        _updateSel(sel, st, img);
-        _setCropBtns(containerId, false);
-    });
-    document.addEventListener('mousemove', function(e) {
-        if (!st.active) return;
-        var rr = _getRenderedRect(img);
-        st.ex = Math.max(0, Math.min(e.clientX - rr.left, rr.width));
-        st.ey = Math.max(0, Math.min(e.clientY - rr.top, rr.height));
-        _updateSel(sel, st, img);
-    });
-    document.addEventListener('mouseup', function() {
-        if (!st.active) return;
-        st.active = false;
-        var w = Math.abs(st.ex - st.sx), h = Math.abs(st.ey - st.sy);
-        st.has = (w > 5 && h > 5);
-        if (!st.has) sel.style.display = 'none';
-        _setCropBtns(containerId, st.has);
-    });
-}
+# Face-crop galleries keyed by image URL. Detections are precomputed in the
+# DB, so the repeated cost of revisiting an image is the Flickr download and
+# per-face crop/encode; the URL identifies the image exactly.
+_FACE_CROPS_CACHE_SIZE = 128
+_face_crops_cache: OrderedDict[str, list[tuple[str, str]]] = OrderedDict()
+_face_crops_lock = threading.Lock()
 
-/* Position the selection div accounting for image offset inside wrapper */
-function _updateSel(el, s, img) {
-    var wr = img.parentElement.getBoundingClientRect();
-    var rr = _getRenderedRect(img);
-    var offX = rr.left - wr.left;
-    var offY = rr.top  - wr.top;
-    var x = Math.min(s.sx, s.ex) + offX;
-    var y = Math.min(s.sy, s.ey) + offY;
-    var w = Math.abs(s.ex - s.sx);
-    var h = Math.abs(s.ey - s.sy);
-    el.style.left = x + 'px'; el.style.top = y + 'px';
-    el.style.width = w + 'px'; el.style.height = h + 'px';
-}
 
-window.initCrop = function(containerId, retries) {
-    retries = retries || 0;
-    var container = document.getElementById(containerId);
-    if (!container) return;
+def _cached_face_crops(
+    image_url: str,
+    faces: list[FaceDetection],
+    meta: ImageMetadata,
+) -> list[tuple[str, str]]:
+    """Return face crops for an image, reusing previously built ones."""
+    with _face_crops_lock:
+        if image_url in _face_crops_cache:
+            _face_crops_cache.move_to_end(image_url)
+            return _face_crops_cache[image_url]
+    items = _make_face_crops(image_url, faces, meta)
+    with _face_crops_lock:
+        _face_crops_cache[image_url] = items
+        while len(_face_crops_cache) > _FACE_CROPS_CACHE_SIZE:
+            _face_crops_cache.popitem(last=False)
+    return items
 
-    /* Clean up previous overlay */
-    container.querySelectorAll('.crop-overlay,.crop-selection')
-             .forEach(function(e){ e.remove(); });
 
-    var img = container.querySelector('img');
-    if (!img || !img.src) {
-        if (retries < 15) {
-            setTimeout(function() { window.initCrop(containerId, retries + 1); }, 200);
-        }
-        return;
-    }
+# ── Static assets (crop tool JS + gallery CSS) ───────────────────────
+# Served as real files rather than inlined into the HTML head: the browser
+# caches them after the first page load (they carry no user data), so every
+# reload skips ~7KB of transfer and re-parse.
+_STATIC_DIR = Path(__file__).parent / "static"
+gr.set_static_paths([_STATIC_DIR])
 
-    if (img.complete && img.naturalWidth > 0) {
-        _setupOverlay(container, img, containerId);
-    } else {
-        img.addEventListener('load', function onload() {
-            img.removeEventListener('load', onload);
-            _setupOverlay(container, img, containerId);
-        });
-    }
-};
-
-/* Get crop data as JSON string (image URL + crop rect in natural pixels) */
-window.getCropData = function(containerId) {
-    var container = document.getElementById(containerId);
-    if (!container) return null;
-    var img = container.querySelector('img');
-    if (!img) return null;
-    var st = window._cropStates[containerId];
-    if (!st || !st.has) return null;
-
-    var rr = _getRenderedRect(img);
-    var scX = img.naturalWidth  / rr.width;
-    var scY = img.naturalHeight / rr.height;
-
-    return JSON.stringify({
-        url: img.src,
-        x: Math.round(Math.min(st.sx, st.ex) * scX),
-        y: Math.round(Math.min(st.sy, st.ey) * scY),
-        w: Math.round(Math.abs(st.ex - st.sx) * scX),
-        h: Math.round(Math.abs(st.ey - st.sy) * scY)
-    });
-};
-</script>
-"""
+STATIC_HEAD = (
+    f'<script src="/gradio_api/file={_STATIC_DIR / "crop_tool.js"}"></script>\n'
+    f'<link rel="stylesheet" href="/gradio_api/file={_STATIC_DIR / "custom.css"}">'
+)
 
 # ── JS snippets for Gradio events ────────────────────────────────────
 
@@ -322,18 +293,22 @@ async () => {
     if (!data) { window._toast('Select an area first', false); return; }
     const d = JSON.parse(data);
     try {
-        /* Load a separate CORS-enabled image for canvas operations */
-        const corsImg = new window.Image();
-        corsImg.crossOrigin = 'anonymous';
-        await new Promise((resolve, reject) => {
-            corsImg.onload = resolve;
-            corsImg.onerror = () => reject(new Error('CORS'));
-            corsImg.src = d.url;
-        });
-        const canvas = document.createElement('canvas');
+        /* Reuse the pooled CORS image / canvas from crop_tool.js; a copy of
+           the same preview skips the reload entirely */
+        const corsImg = window._cropCorsImg;
+        if (corsImg.src !== d.url || !corsImg.complete) {
+            await new Promise((resolve, reject) => {
+                corsImg.onload = resolve;
+                corsImg.onerror = () => reject(new Error('CORS'));
+                corsImg.src = d.url;
+            });
+        }
+        const canvas = window._cropCanvas;
         canvas.width = d.w;
         canvas.height = d.h;
-        canvas.getContext('2d').drawImage(corsImg, d.x, d.y, d.w, d.h, 0, 0, d.w, d.h);
+        const ctx = canvas.getContext('2d');
+        ctx.clearRect(0, 0, d.w, d.h);
+        ctx.drawImage(corsImg, d.x, d.y, d.w, d.h, 0, 0, d.w, d.h);
         const blob = await new Promise(r => canvas.toBlob(r, 'image/png'));
         await navigator.clipboard.write([new ClipboardItem({'image/png': blob})]);
         window._toast('Cropped area copied!', true);
@@ -352,85 +327,255 @@ CROP_TO_JSON_JS = """
 """
 
 
+class GalleryItem(NamedTuple):
+    """One result tile: the 320px tile URL plus its score/event caption.
+
+    Being a tuple subclass it serializes to gr.Gallery exactly like the
+    (url, caption) pairs it replaces, but handlers that read it back out of
+    server-side state can use the fields by name instead of probing the
+    shape with isinstance/len checks.
+    """
+
+    url: str
+    caption: str
+
+
+class _SearchTab(NamedTuple):
+    """Widgets and states for one search tab, built by the tab factory.
+
+    Both tabs share the same result/preview widget set; bundling them keeps
+    the event wiring in one place and lets handlers capture just this tuple
+    instead of every local in create_app.
+    """
+
+    preview_id: str
+    event_filter: gr.Dropdown
+    preview_image: gr.Image
+    preview_caption: gr.Markdown
+    find_similar_btn: gr.Button
+    search_cropped_btn: gr.Button
+    copy_clipboard_btn: gr.Button
+    close_btn: gr.Button
+    face_gallery: gr.Gallery
+    thumb_strip: gr.Gallery
+    gallery: gr.Gallery
+    info: gr.Markdown
+    load_more_btn: gr.Button
+    crop_data: gr.Textbox
+    offset_state: gr.State
+    prefetch_state: gr.State
+    results_state: gr.State
+    metadata_state: gr.State
+    embedding_state: gr.State
+    selected_index_state: gr.State
+    face_detections_state: gr.State
+
+    @property
+    def search_outputs(self) -> list:
+        return [
+            self.gallery,
+            self.info,
+            self.offset_state,
+            self.prefetch_state,
+            self.results_state,
+            self.metadata_state,
+            self.embedding_state,
+            self.load_more_btn,
+        ]
+
+    @property
+    def load_more_outputs(self) -> list:
+        return [
+            self.gallery,
+            self.info,
+            self.offset_state,
+            self.prefetch_state,
+            self.results_state,
+            self.metadata_state,
+            self.load_more_btn,
+        ]
+
+    @property
+    def close_outputs(self) -> list:
+        return [
+            self.preview_image,
+            self.preview_caption,
+            self.thumb_strip,
+            self.close_btn,
+            self.find_similar_btn,
+            self.search_cropped_btn,
+            self.copy_clipboard_btn,
+            self.face_gallery,
+            self.face_detections_state,
+        ]
+
+
 _MODEL_CHOICES = ["SigLIP 2 base", "SigLIP 2 Large", "CLIP-L"]
 
 
+# Event names per database path, fetched once per process. create_app can run
+# more than once (tests, multi-worker launchers), and the list only changes
+# when a new event is ingested — which needs an app restart anyway.
+_event_names_cache: dict[str, tuple[str, ...]] = {}
+
+
+def _cached_event_names(conn, db_path: str) -> tuple[str, ...]:
+    names = _event_names_cache.get(db_path)
+    if names is None:
+        names = _event_names_cache[db_path] = tuple(get_event_names(conn))
+    return names
+
+
+def _open_search_db(db_path: str | None = None, embedding_dim: int = 768):
+    """Open a DB for searching, read-only when the file already exists.
+
+    The search app never writes, and a read-only DuckDB connection skips
+    write-lock/WAL bookkeeping while allowing other processes (e.g. the
+    embedding pipeline) to keep writing. On a first run the file may not
+    exist yet, so fall back to a writable connection that creates the schema.
+    """
+    try:
+        return get_connection(db_path, embedding_dim=embedding_dim, read_only=True)
+    except duckdb.Error:
+        return get_connection(db_path, embedding_dim=embedding_dim)
+
+
 def create_app() -> gr.Blocks:
     """Create and return the Gradio Blocks app."""
-    conn_siglip = get_connection(embedding_dim=768)
-    conn_siglip_large = get_connection(
+    conn_siglip = _open_search_db(embedding_dim=768)
+    conn_siglip_large = _open_search_db(
         str(SIGLIP_LARGE_DB_PATH), embedding_dim=SIGLIP_LARGE_EMBEDDING_DIM
     )
-    conn_clip = get_connection(str(CLIP_DB_PATH))
+    conn_clip = _open_search_db(str(CLIP_DB_PATH))
+
+    # Face lookups and face-similarity queries hit conn_clip from several
+    # handlers at once; a small cursor pool lets them run in parallel instead
+    # of serializing on the connection lock. The parent connections stay as
+    # the search handles because they key the in-memory matrix cache.
+    face_cursor_pool = CursorPool(conn_clip, size=4)
 
-    event_names = get_event_names(conn_siglip)
+    event_names = _cached_event_names(conn_siglip, str(DB_PATH))
 
-    # Lazy-loaded embedders (keyed by model choice label)
+    # Lazy-loaded embedders (keyed by model choice label).  The lock prevents
+    # concurrent first requests from double-initializing the same model;
+    # lru_cache makes the steady-state per-click lookup a single dict hit
+    # (it does not dedupe concurrent first misses, hence the lock stays).
     _embedder_cache: dict = {}
+    _embedder_lock = threading.Lock()
 
+    @lru_cache(maxsize=len(_MODEL_CHOICES))
     def _get_model_config(model_choice: str) -> tuple:
         """Return (conn, model_name, embedder, embedding_dim) for the chosen model."""
-        if model_choice == "CLIP-L":
-            conn = conn_clip
-            model_name = CLIP_MODEL_NAME
-            embedding_dim = 768
-            if "clip" not in _embedder_cache:
-                from pyconjp_image_search.embedding.clip import CLIPEmbedder
-
-                _embedder_cache["clip"] = CLIPEmbedder(model_name=CLIP_MODEL_NAME)
-            embedder = _embedder_cache["clip"]
-        elif model_choice == "SigLIP 2 Large":
-            conn = conn_siglip_large
-            model_name = SIGLIP_LARGE_MODEL_NAME
-            embedding_dim = SIGLIP_LARGE_EMBEDDING_DIM
-            if "siglip-large" not in _embedder_cache:
-                from pyconjp_image_search.embedding.siglip import SigLIPEmbedder
-
-                _embedder_cache["siglip-large"] = SigLIPEmbedder(
-                    model_name=SIGLIP_LARGE_MODEL_NAME
-                )
-            embedder = _embedder_cache["siglip-large"]
-        else:  # SigLIP 2 base
-            conn = conn_siglip
-            model_name = SIGLIP_MODEL_NAME
-            embedding_dim = 768
-            if "siglip" not in _embedder_cache:
-                from pyconjp_image_search.embedding.siglip import SigLIPEmbedder
-
-                _embedder_cache["siglip"] = SigLIPEmbedder(model_name=SIGLIP_MODEL_NAME)
-            embedder = _embedder_cache["siglip"]
-        return conn, model_name, embedder, embedding_dim
+        with _embedder_lock:
+            if model_choice == "CLIP-L":
+                conn = conn_clip
+                model_name = CLIP_MODEL_NAME
+                embedding_dim = 768
+                if "clip" not in _embedder_cache:
+                    from pyconjp_image_search.embedding.clip import CLIPEmbedder
+
+                    _embedder_cache["clip"] = CLIPEmbedder(model_name=CLIP_MODEL_NAME)
+                embedder = _embedder_cache["clip"]
+            elif model_choice == "SigLIP 2 Large":
+                conn = conn_siglip_large
+                model_name = SIGLIP_LARGE_MODEL_NAME
+                embedding_dim = SIGLIP_LARGE_EMBEDDING_DIM
+                if "siglip-large" not in _embedder_cache:
+                    from pyconjp_image_search.embedding.siglip import SigLIPEmbedder
+
+                    _embedder_cache["siglip-large"] = SigLIPEmbedder(
+                        model_name=SIGLIP_LARGE_MODEL_NAME
+                    )
+                embedder = _embedder_cache["siglip-large"]
+            else:  # SigLIP 2 base
+                conn = conn_siglip
+                model_name = SIGLIP_MODEL_NAME
+                embedding_dim = 768
+                if "siglip" not in _embedder_cache:
+                    from pyconjp_image_search.embedding.siglip import SigLIPEmbedder
+
+                    _embedder_cache["siglip"] = SigLIPEmbedder(model_name=SIGLIP_MODEL_NAME)
+                embedder = _embedder_cache["siglip"]
+            return conn, model_name, embedder, embedding_dim
+
+    def _warm_embedders() -> None:
+        """Pre-initialize the default and CLIP embedders off the request path.
+
+        The warm-up embed also triggers torch.compile codegen for compiled
+        models, so the first real query skips the one-time compile cost, and
+        it doubles as a cache seed: the embeddings for a handful of queries
+        people type at every deployment land in the text-embed LRU before the
+        first user arrives.
+        """
+        for choice in ("SigLIP 2 base", "CLIP-L"):
+            try:
+                _, model_name, embedder, _ = _get_model_config(choice)
+                warm = _embed_pool.submit(embedder.embed_texts, list(_WARMUP_QUERIES)).result()
+                for query, emb in zip(_WARMUP_QUERIES, warm):
+                    _text_embed_cache.put((model_name, query), emb[None, :])
+            except Exception:  # noqa: BLE001 - warm-up is best-effort
+                pass
+
+    def _submit_prefetch(
+        mc,
+        query_emb: np.ndarray,
+        model_name: str,
+        offset: int,
+        selected_events: list[str],
+        edim: int,
+    ) -> tuple:
+        """Kick off a background fetch of the result page at `offset`."""
+        key = _prefetch_key(model_name, selected_events, offset, query_emb)
+        future = _prefetch_pool.submit(
+            search_images_by_text,
+            mc,
+            query_embedding=query_emb,
+            model_name=model_name,
+            limit=PAGE_SIZE,
+            offset=offset,
+            event_names=selected_events or None,
+            embedding_dim=edim,
+        )
+        return key, future
 
     def _make_gallery_items(
         results: list[tuple[ImageMetadata, float]],
-    ) -> tuple[list[tuple[str, str]], list[ImageMetadata]]:
+    ) -> tuple[list[GalleryItem], list[ImageMetadata]]:
         """Build gallery items and metadata list from search results."""
-        items = []
-        metadata = []
-        for meta, score in results:
-            url = _flickr_url_resize(meta.image_url, "z")  # 640px for gallery
-            caption = f"score: {score:.3f} | {meta.event_name}"
-            items.append((url, caption))
-            metadata.append(meta)
+        # Gallery tiles render small; the 320px Flickr variant cuts
+        # bytes-on-wire ~4x vs 640px while the preview stays full size.
+        items = [
+            GalleryItem(
+                _flickr_url_resize(meta.image_url, "n"),
+                f"score: {score:.3f} | {meta.event_name}",
+            )
+            for meta, score in results
+        ]
+        metadata = [meta for meta, _ in results]
         return items, metadata
 
-    def _get_preview_url(gallery_item):
-        url = gallery_item[0] if isinstance(gallery_item, (list, tuple)) else gallery_item
-        return _flickr_url_resize(url, "b") if "staticflickr.com" in url else url
+    def _make_thumb_strip(gallery_items: list[GalleryItem]) -> list[GalleryItem]:
+        """Re-target gallery items at the 150px-square Flickr variant.
+
+        The strip renders 100px tiles, so the square "q" size is a better fit
+        than the 320px gallery variant — roughly a quarter of the bytes per
+        thumb, and the crop is done by Flickr instead of the browser.
+        """
+        return [
+            GalleryItem(_flickr_url_resize(item.url, "q"), item.caption) for item in gallery_items
+        ]
+
+    def _get_preview_url(item: GalleryItem) -> str:
+        return _flickr_url_resize(item.url, "b") if "staticflickr.com" in item.url else item.url
 
     # ── Preview helpers ──────────────────────────────────────────────
 
-    def _build_preview_caption(gallery_item, metadata_list, index):
-        caption = ""
-        if isinstance(gallery_item, (list, tuple)) and len(gallery_item) > 1:
-            caption = gallery_item[1]
-        if index is not None and index < len(metadata_list):
+    def _build_preview_caption(item: GalleryItem, metadata_list, index):
+        caption = item.caption
+        if index < len(metadata_list):
             meta = metadata_list[index]
-            if meta.flickr_photo_id and FLICKR_USER_ID:
-                page_url = (
-                    f"https://www.flickr.com/photos/{FLICKR_USER_ID}/{meta.flickr_photo_id}/"
-                )
-                caption += f" | [Flickr で開く]({page_url})"
+            if meta.flickr_photo_id and _FLICKR_BASE:
+                caption += f" | [Flickr で開く]({_FLICKR_BASE}{meta.flickr_photo_id}/)"
         return caption
 
     def _on_gallery_select(gallery_items: list, metadata_list: list, evt: gr.EventData):
@@ -441,23 +586,25 @@ def create_app() -> gr.Blocks:
             preview_url = _get_preview_url(item)
             # Fetch face detections for this image
             meta = metadata_list[index]
-            faces = (
-                get_faces_for_image(conn_clip, meta.id, INSIGHTFACE_MODEL_NAME) if meta.id else []
-            )
-            face_crops = _make_face_crops(meta.image_url, faces, meta) if faces else []
+            if meta.id:
+                with face_cursor_pool.acquire() as cur:
+                    faces = get_faces_for_image(cur, meta.id, INSIGHTFACE_MODEL_NAME)
+            else:
+                faces = []
+            face_crops = _cached_face_crops(meta.image_url, faces, meta) if faces else []
             return (
                 gr.update(value=preview_url, visible=True),
                 gr.update(value=caption, visible=True),
-                gr.update(value=gallery_items, visible=True),
-                gr.update(visible=True),  # close btn
-                gr.update(visible=True),  # find similar btn
-                gr.update(visible=True),  # search cropped btn (JS will disable)
-                gr.update(visible=True),  # copy clipboard btn (JS will disable)
+                gr.update(value=_make_thumb_strip(gallery_items), visible=True),
+                _SHOW,  # close btn
+                _SHOW,  # find similar btn
+                _SHOW,  # search cropped btn (JS will disable)
+                _SHOW,  # copy clipboard btn (JS will disable)
                 index,
                 gr.update(value=face_crops, visible=bool(faces)),  # face gallery
                 faces,  # face detections state
             )
-        hidden = gr.update(visible=False)
+        hidden = _HIDE
         return (hidden, hidden, hidden, hidden, hidden, hidden, hidden, None, hidden, [])
 
     def _on_thumb_select(gallery_items: list, metadata_list: list, evt: gr.EventData):
@@ -467,10 +614,12 @@ def create_app() -> gr.Blocks:
             caption = _build_preview_caption(item, metadata_list, index)
             preview_url = _get_preview_url(item)
             meta = metadata_list[index]
-            faces = (
-                get_faces_for_image(conn_clip, meta.id, INSIGHTFACE_MODEL_NAME) if meta.id else []
-            )
-            face_crops = _make_face_crops(meta.image_url, faces, meta) if faces else []
+            if meta.id:
+                with face_cursor_pool.acquire() as cur:
+                    faces = get_faces_for_image(cur, meta.id, INSIGHTFACE_MODEL_NAME)
+            else:
+                faces = []
+            face_crops = _cached_face_crops(meta.image_url, faces, meta) if faces else []
             return (
                 gr.update(value=preview_url),
                 gr.update(value=caption),
@@ -478,20 +627,7 @@ def create_app() -> gr.Blocks:
                 gr.update(value=face_crops, visible=bool(faces)),
                 faces,
             )
-        return gr.update(), gr.update(), None, gr.update(visible=False), []
-
-    def _on_close_preview():
-        return (
-            gr.update(value=None, visible=False),
-            gr.update(value="", visible=False),
-            gr.update(value=None, visible=False),
-            gr.update(visible=False),
-            gr.update(visible=False),
-            gr.update(visible=False),
-            gr.update(visible=False),
-            gr.update(value=None, visible=False),  # face gallery
-            [],  # face detections
-        )
+        return gr.update(), gr.update(), None, _HIDE, []
 
     # ── Cross-tab handlers ───────────────────────────────────────────
 
@@ -529,13 +665,13 @@ def create_app() -> gr.Blocks:
             PAGE_SIZE,
             gallery_items,
             new_metadata,
-            emb.tolist(),
-            gr.update(visible=has_more),
+            _emb_to_state(emb),
+            _SHOW if has_more else _HIDE,
             selected_events,
             source_url,
             gr.Tabs(selected=1),
             None,  # clear face embedding
-            gr.update(visible=False),  # hide face search button
+            _HIDE,  # hide face search button
         )
 
     def _do_search_cropped(
@@ -549,21 +685,32 @@ def create_app() -> gr.Blocks:
         url = data["url"]
         x, y, w, h = data["x"], data["y"], data["w"], data["h"]
 
-        # Download image from Flickr URL
-        response = urllib.request.urlopen(url)  # noqa: S310
-        img = Image.open(BytesIO(response.read())).convert("RGB")
-
-        # Crop the selected region
-        cropped = img.crop((x, y, x + w, y + h))
-
-        # Save to temp file
-        tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
-        cropped.save(tmp, format="PNG")
-        tmp.close()
-        image_path = Path(tmp.name)
-
         mc, model_name, embedder, edim = _get_model_config(model_choice)
-        query_emb = embedder.embed_images([image_path])
+        crop_key = (model_name, hashlib.sha256(f"{url}|{x}|{y}|{w}|{h}".encode()).hexdigest())
+        cached = _crop_embed_cache.get(crop_key)
+        if cached is not None:
+            query_emb, image_path = cached
+        else:
+            # Download image from Flickr URL; PIL decodes straight from the
+            # response instead of a second in-memory copy
+            with urllib.request.urlopen(url) as response:  # noqa: S310
+                img = Image.open(response).convert("RGB")
+
+            # Crop the selected region
+            cropped = img.crop((x, y, x + w, y + h))
+
+            # The temp file only feeds the upload-widget preview; the embedder
+            # takes the in-memory crop directly, skipping a PNG decode.
+            tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
+            cropped.save(tmp, format="PNG")
+            tmp.close()
+            image_path = Path(tmp.name)
+
+            # Serialize inference behind the shared single-thread embed pool
+            # so a crop search cannot run a forward pass concurrently with the
+            # async search handlers (the models are not re-entrant).
+            query_emb = _embed_pool.submit(embedder.embed_pil, [cropped]).result()
+            _crop_embed_cache.put(crop_key, (query_emb, image_path))
         results = search_images_by_text(
             mc,
             query_embedding=query_emb,
@@ -582,13 +729,13 @@ def create_app() -> gr.Blocks:
             PAGE_SIZE,
             gallery_items,
             new_metadata,
-            query_emb.tolist(),
-            gr.update(visible=has_more),
+            _emb_to_state(query_emb),
+            _SHOW if has_more else _HIDE,
             selected_events,
             str(image_path),
             gr.Tabs(selected=1),
             None,  # clear face embedding
-            gr.update(visible=False),  # hide face search button
+            _HIDE,  # hide face search button
         )
 
     def _do_face_search(
@@ -602,13 +749,14 @@ def create_app() -> gr.Blocks:
         if face_index is None or face_index >= len(face_detections):
             return _noop_12
         face = face_detections[face_index]
-        results = search_faces_by_embedding(
-            conn_clip,
-            face.embedding,
-            INSIGHTFACE_MODEL_NAME,
-            limit=PAGE_SIZE * 2,  # extra to account for dedup
-            event_names=selected_events or None,
-        )
+        with face_cursor_pool.acquire() as cur:
+            results = search_faces_by_embedding(
+                cur,
+                face.embedding,
+                INSIGHTFACE_MODEL_NAME,
+                limit=PAGE_SIZE * 2,  # extra to account for dedup
+                event_names=selected_events or None,
+            )
         # Deduplicate by image_id (keep highest score per image)
         seen: dict[int, tuple[ImageMetadata, float]] = {}
         for _face_det, meta, score in results:
@@ -631,12 +779,12 @@ def create_app() -> gr.Blocks:
             gallery_items,
             new_metadata,
             None,  # no embedding for load-more
-            gr.update(visible=False),  # no load more for face search
+            _HIDE,  # no load more for face search
             selected_events,
             face_crop_path,  # show face crop in Image Search upload
             gr.Tabs(selected=1),
             face.embedding,  # store face embedding for re-search
-            gr.update(visible=True),  # show face search button
+            _SHOW,  # show face search button
         )
 
     def _do_face_search_from_state(
@@ -646,13 +794,14 @@ def create_app() -> gr.Blocks:
         """Re-search by stored face embedding."""
         if face_embedding_data is None:
             return _noop_12
-        results = search_faces_by_embedding(
-            conn_clip,
-            face_embedding_data,
-            INSIGHTFACE_MODEL_NAME,
-            limit=PAGE_SIZE * 2,
-            event_names=selected_events or None,
-        )
+        with face_cursor_pool.acquire() as cur:
+            results = search_faces_by_embedding(
+                cur,
+                face_embedding_data,
+                INSIGHTFACE_MODEL_NAME,
+                limit=PAGE_SIZE * 2,
+                event_names=selected_events or None,
+            )
         seen: dict[int, tuple[ImageMetadata, float]] = {}
         for _face_det, meta, score in results:
             if meta.id is None:
@@ -669,17 +818,337 @@ def create_app() -> gr.Blocks:
             gallery_items,
             new_metadata,
             None,  # no CLIP embedding
-            gr.update(visible=False),  # no load more
+            _HIDE,  # no load more
             selected_events,
             gr.update(),  # keep image_input as is
             gr.update(),  # don't switch tabs
             face_embedding_data,  # keep face embedding
-            gr.update(visible=True),  # keep button visible
+            _SHOW,  # keep button visible
+        )
+
+    # ── Shared search handlers (identical for both tabs) ─────────────
+
+    def _run_search(
+        mc,
+        model_name: str,
+        edim: int,
+        query_emb: np.ndarray,
+        selected_events: list[str],
+        message_fmt: str,
+    ) -> tuple:
+        """Run the first result page for a fresh query embedding."""
+        results = _search_flight.do(
+            _prefetch_key(model_name, selected_events, 0, query_emb),
+            search_images_by_text,
+            mc,
+            query_embedding=query_emb,
+            model_name=model_name,
+            limit=PAGE_SIZE,
+            offset=0,
+            event_names=selected_events or None,
+            embedding_dim=edim,
+        )
+        gallery_items, metadata = _make_gallery_items(results)
+        has_more = len(results) == PAGE_SIZE
+        prefetch = (
+            _submit_prefetch(mc, query_emb, model_name, PAGE_SIZE, selected_events, edim)
+            if has_more
+            else None
+        )
+        return (
+            gallery_items,
+            message_fmt.format(len(results)),
+            PAGE_SIZE,
+            prefetch,
+            gallery_items,
+            metadata,
+            _emb_to_state(query_emb),
+            _SHOW if has_more else _HIDE,
+        )
+
+    # The search handlers also emit the close-preview updates so one Gradio
+    # event covers "show results + reset preview" — the old
+    # .click(...).then(_on_close_preview) chain cost a second server
+    # round-trip per search. They are async generators: Gradio streams each
+    # yield, so the "Searching..." placeholder lands before the model runs.
+
+    async def do_text_search(query: str, selected_events: list[str], model_choice: str):
+        if not query.strip():
+            yield _EMPTY_TEXT_SEARCH + _CLOSE_UPDATES
+            return
+        yield _SEARCHING_TEXT
+        loop = asyncio.get_running_loop()
+        mc, model_name, embedder, edim = await loop.run_in_executor(
+            _embed_pool, _get_model_config, model_choice
+        )
+        cache_key = (model_name, query.strip().lower())
+        query_emb = _text_embed_cache.get(cache_key)
+        if query_emb is None:
+            query_emb = await loop.run_in_executor(_embed_pool, embedder.embed_text, query)
+            _text_embed_cache.put(cache_key, query_emb)
+        result = await loop.run_in_executor(
+            _db_pool,
+            _run_search,
+            mc,
+            model_name,
+            edim,
+            query_emb,
+            selected_events,
+            f"Found {{}} images for '{query}'.",
+        )
+        yield result + _CLOSE_UPDATES
+
+    async def do_image_search(
+        image_path: str | None, selected_events: list[str], model_choice: str
+    ):
+        # The trailing pair clears the stored face embedding and hides the
+        # face-search button (previously a third chained event).
+        if image_path is None:
+            yield _EMPTY_IMAGE_SEARCH + _CLOSE_UPDATES + (None, _HIDE)
+            return
+        yield _SEARCHING_IMAGE
+        loop = asyncio.get_running_loop()
+        mc, model_name, embedder, edim = await loop.run_in_executor(
+            _embed_pool, _get_model_config, model_choice
+        )
+        query_emb = await loop.run_in_executor(
+            _embed_pool, _embed_upload, embedder, model_name, image_path
+        )
+        result = await loop.run_in_executor(
+            _db_pool,
+            _run_search,
+            mc,
+            model_name,
+            edim,
+            query_emb,
+            selected_events,
+            "Found {} similar images.",
+        )
+        yield result + _CLOSE_UPDATES + (None, _HIDE)
+
+    async def do_load_more(
+        selected_events: list[str],
+        offset: int,
+        prefetch,
+        accumulated: list,
+        accumulated_meta: list,
+        query_emb: np.ndarray | None,
+        model_choice: str,
+    ) -> tuple:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _db_pool,
+            _load_more_page,
+            selected_events,
+            offset,
+            prefetch,
+            accumulated,
+            accumulated_meta,
+            query_emb,
+            model_choice,
+        )
+
+    def _load_more_page(
+        selected_events: list[str],
+        offset: int,
+        prefetch,
+        accumulated: list,
+        accumulated_meta: list,
+        query_emb: np.ndarray | None,
+        model_choice: str,
+    ) -> tuple:
+        if query_emb is None:
+            return (
+                accumulated,
+                "No active search.",
+                offset,
+                None,
+                accumulated,
+                accumulated_meta,
+                _HIDE,
+            )
+        mc, model_name, _, edim = _get_model_config(model_choice)
+        results = None
+        if prefetch is not None and prefetch[0] == _prefetch_key(
+            model_name, selected_events, offset, query_emb
+        ):
+            results = prefetch[1].result()
+        if results is None:
+            results = _search_flight.do(
+                _prefetch_key(model_name, selected_events, offset, query_emb),
+                search_images_by_text,
+                mc,
+                query_embedding=query_emb,
+                model_name=model_name,
+                limit=PAGE_SIZE,
+                offset=offset,
+                event_names=selected_events or None,
+                embedding_dim=edim,
+            )
+        new_items, new_meta = _make_gallery_items(results)
+        # The handler owns the session's state lists, so growing them in
+        # place avoids re-copying the whole accumulated gallery every click.
+        accumulated.extend(new_items)
+        accumulated_meta.extend(new_meta)
+        if len(accumulated) > MAX_GALLERY:
+            # Trim both lists identically so gallery indices keep lining up
+            # with the metadata the select handlers read.
+            del accumulated[: len(accumulated) - MAX_GALLERY]
+            del accumulated_meta[: len(accumulated_meta) - MAX_GALLERY]
+        has_more = len(results) == PAGE_SIZE
+        next_prefetch = (
+            _submit_prefetch(
+                mc, query_emb, model_name, offset + len(results), selected_events, edim
+            )
+            if has_more
+            else None
+        )
+        return (
+            accumulated,
+            f"Showing {len(accumulated)} images.",
+            offset + len(results),
+            next_prefetch,
+            accumulated,
+            accumulated_meta,
+            _SHOW if has_more else _HIDE,
         )
 
     # ── Build UI ─────────────────────────────────────────────────────
 
-    with gr.Blocks(title="PyCon JP Image Search", css=CUSTOM_CSS, head=CROP_TOOL_SCRIPT) as app:
+    def _build_search_tab(elem_prefix: str, event_filter: gr.Dropdown) -> _SearchTab:
+        """Build the result/preview widget set shared by both search tabs.
+
+        Also wires the events that stay within the tab (load more, preview
+        select/close, clipboard copy); cross-tab wiring happens after both
+        tabs exist.
+        """
+        preview_id = f"{elem_prefix}-preview"
+        preview_image = gr.Image(
+            label="Preview",
+            visible=False,
+            height=480,
+            elem_id=preview_id,
+        )
+        preview_caption = gr.Markdown("", visible=False)
+        with gr.Row():
+            find_similar_btn = gr.Button("Find Similar", visible=False)
+            search_cropped_btn = gr.Button(
+                "Search Cropped",
+                visible=False,
+                elem_id=f"{elem_prefix}-search-cropped-btn",
+            )
+            copy_clipboard_btn = gr.Button(
+                "Copy to Clipboard",
+                visible=False,
+                elem_id=f"{elem_prefix}-copy-clipboard-btn",
+            )
+            close_btn = gr.Button("Close Preview", visible=False)
+        face_gallery = gr.Gallery(
+            label="Detected Faces (click to find same person)",
+            visible=False,
+            rows=1,
+            height=100,
+            allow_preview=False,
+            elem_classes=["thumb-strip"],
+        )
+        thumb_strip = gr.Gallery(
+            label="",
+            visible=False,
+            rows=1,
+            height=100,
+            allow_preview=False,
+            elem_classes=["thumb-strip"],
+        )
+
+        gallery = gr.Gallery(
+            label="Results",
+            columns=4,
+            height="auto",
+            allow_preview=False,
+            elem_classes=["full-height-gallery"],
+        )
+        info = gr.Markdown("")
+        load_more_btn = gr.Button("Load More", visible=False)
+        crop_data = gr.Textbox(visible=False, elem_id=f"{elem_prefix}-crop-data")
+
+        tab = _SearchTab(
+            preview_id=preview_id,
+            event_filter=event_filter,
+            preview_image=preview_image,
+            preview_caption=preview_caption,
+            find_similar_btn=find_similar_btn,
+            search_cropped_btn=search_cropped_btn,
+            copy_clipboard_btn=copy_clipboard_btn,
+            close_btn=close_btn,
+            face_gallery=face_gallery,
+            thumb_strip=thumb_strip,
+            gallery=gallery,
+            info=info,
+            load_more_btn=load_more_btn,
+            crop_data=crop_data,
+            offset_state=gr.State(0),
+            prefetch_state=gr.State(None),
+            results_state=gr.State([]),
+            metadata_state=gr.State([]),
+            embedding_state=gr.State(None),
+            selected_index_state=gr.State(None),
+            face_detections_state=gr.State([]),
+        )
+
+        load_more_btn.click(
+            fn=do_load_more,
+            inputs=[
+                event_filter,
+                tab.offset_state,
+                tab.prefetch_state,
+                tab.results_state,
+                tab.metadata_state,
+                tab.embedding_state,
+                model_selector,
+            ],
+            outputs=tab.load_more_outputs,
+        )
+        gallery.select(
+            fn=_on_gallery_select,
+            inputs=[tab.results_state, tab.metadata_state],
+            outputs=[
+                preview_image,
+                preview_caption,
+                thumb_strip,
+                close_btn,
+                find_similar_btn,
+                search_cropped_btn,
+                copy_clipboard_btn,
+                tab.selected_index_state,
+                face_gallery,
+                tab.face_detections_state,
+            ],
+            js=SCROLL_AND_INIT_CROP_JS % (preview_id, preview_id),
+        )
+        thumb_strip.select(
+            fn=_on_thumb_select,
+            inputs=[tab.results_state, tab.metadata_state],
+            outputs=[
+                preview_image,
+                preview_caption,
+                tab.selected_index_state,
+                face_gallery,
+                tab.face_detections_state,
+            ],
+            js=REINIT_CROP_JS % preview_id,
+        )
+        close_btn.click(
+            fn=_on_close_preview,
+            outputs=tab.close_outputs,
+        )
+        copy_clipboard_btn.click(
+            fn=None,
+            js=COPY_CLIPBOARD_JS % preview_id,
+        )
+        return tab
+
+    # css/head moved to launch() in Gradio 6; main() passes STATIC_HEAD there.
+    with gr.Blocks(title="PyCon JP Image Search") as app:
         gr.Markdown("# PyCon JP Image Search")
 
         model_selector = gr.Radio(
@@ -705,230 +1174,7 @@ def create_app() -> gr.Blocks:
                     )
                     text_btn = gr.Button("Search")
 
-                text_preview_image = gr.Image(
-                    label="Preview",
-                    visible=False,
-                    height=480,
-                    elem_id="text-preview",
-                )
-                text_preview_caption = gr.Markdown("", visible=False)
-                with gr.Row():
-                    text_find_similar_btn = gr.Button("Find Similar", visible=False)
-                    text_search_cropped_btn = gr.Button(
-                        "Search Cropped",
-                        visible=False,
-                        elem_id="text-search-cropped-btn",
-                    )
-                    text_copy_clipboard_btn = gr.Button(
-                        "Copy to Clipboard",
-                        visible=False,
-                        elem_id="text-copy-clipboard-btn",
-                    )
-                    text_close_btn = gr.Button("Close Preview", visible=False)
-                text_face_gallery = gr.Gallery(
-                    label="Detected Faces (click to find same person)",
-                    visible=False,
-                    rows=1,
-                    height=100,
-                    allow_preview=False,
-                    elem_classes=["thumb-strip"],
-                )
-                text_thumb_strip = gr.Gallery(
-                    label="",
-                    visible=False,
-                    rows=1,
-                    height=100,
-                    allow_preview=False,
-                    elem_classes=["thumb-strip"],
-                )
-
-                text_gallery = gr.Gallery(
-                    label="Results",
-                    columns=4,
-                    height="auto",
-                    allow_preview=False,
-                    elem_classes=["full-height-gallery"],
-                )
-                text_info = gr.Markdown("")
-                text_load_more_btn = gr.Button("Load More", visible=False)
-                text_crop_data = gr.Textbox(visible=False, elem_id="text-crop-data")
-
-                text_offset_state = gr.State(0)
-                text_results_state = gr.State([])
-                text_metadata_state = gr.State([])
-                text_embedding_state = gr.State(None)
-                text_selected_index_state = gr.State(None)
-                text_face_detections_state = gr.State([])
-
-                def do_text_search(
-                    query: str, selected_events: list[str], model_choice: str
-                ) -> tuple:
-                    if not query.strip():
-                        return (
-                            [],
-                            "Please enter a search query.",
-                            0,
-                            [],
-                            [],
-                            None,
-                            gr.update(visible=False),
-                        )
-                    mc, model_name, embedder, edim = _get_model_config(model_choice)
-                    query_emb = embedder.embed_text(query)
-                    results = search_images_by_text(
-                        mc,
-                        query_embedding=query_emb,
-                        model_name=model_name,
-                        limit=PAGE_SIZE,
-                        offset=0,
-                        event_names=selected_events or None,
-                        embedding_dim=edim,
-                    )
-                    gallery_items, metadata = _make_gallery_items(results)
-                    has_more = len(results) == PAGE_SIZE
-                    return (
-                        gallery_items,
-                        f"Found {len(results)} images for '{query}'.",
-                        PAGE_SIZE,
-                        gallery_items,
-                        metadata,
-                        query_emb.tolist(),
-                        gr.update(visible=has_more),
-                    )
-
-                def do_text_load_more(
-                    selected_events: list[str],
-                    offset: int,
-                    accumulated: list,
-                    accumulated_meta: list,
-                    query_emb_list,
-                    model_choice: str,
-                ) -> tuple:
-                    if query_emb_list is None:
-                        return (
-                            accumulated,
-                            "No active search.",
-                            offset,
-                            accumulated,
-                            accumulated_meta,
-                            gr.update(visible=False),
-                        )
-                    mc, model_name, _, edim = _get_model_config(model_choice)
-                    query_emb = np.array(query_emb_list)
-                    results = search_images_by_text(
-                        mc,
-                        query_embedding=query_emb,
-                        model_name=model_name,
-                        limit=PAGE_SIZE,
-                        offset=offset,
-                        event_names=selected_events or None,
-                        embedding_dim=edim,
-                    )
-                    new_items, new_meta = _make_gallery_items(results)
-                    combined = accumulated + new_items
-                    combined_meta = accumulated_meta + new_meta
-                    has_more = len(results) == PAGE_SIZE
-                    return (
-                        combined,
-                        f"Showing {len(combined)} images.",
-                        offset + len(results),
-                        combined,
-                        combined_meta,
-                        gr.update(visible=has_more),
-                    )
-
-                text_btn.click(
-                    fn=do_text_search,
-                    inputs=[text_input, text_event_filter, model_selector],
-                    outputs=[
-                        text_gallery,
-                        text_info,
-                        text_offset_state,
-                        text_results_state,
-                        text_metadata_state,
-                        text_embedding_state,
-                        text_load_more_btn,
-                    ],
-                ).then(
-                    fn=_on_close_preview,
-                    outputs=[
-                        text_preview_image,
-                        text_preview_caption,
-                        text_thumb_strip,
-                        text_close_btn,
-                        text_find_similar_btn,
-                        text_search_cropped_btn,
-                        text_copy_clipboard_btn,
-                        text_face_gallery,
-                        text_face_detections_state,
-                    ],
-                )
-                text_load_more_btn.click(
-                    fn=do_text_load_more,
-                    inputs=[
-                        text_event_filter,
-                        text_offset_state,
-                        text_results_state,
-                        text_metadata_state,
-                        text_embedding_state,
-                        model_selector,
-                    ],
-                    outputs=[
-                        text_gallery,
-                        text_info,
-                        text_offset_state,
-                        text_results_state,
-                        text_metadata_state,
-                        text_load_more_btn,
-                    ],
-                )
-                text_gallery.select(
-                    fn=_on_gallery_select,
-                    inputs=[text_results_state, text_metadata_state],
-                    outputs=[
-                        text_preview_image,
-                        text_preview_caption,
-                        text_thumb_strip,
-                        text_close_btn,
-                        text_find_similar_btn,
-                        text_search_cropped_btn,
-                        text_copy_clipboard_btn,
-                        text_selected_index_state,
-                        text_face_gallery,
-                        text_face_detections_state,
-                    ],
-                    js=SCROLL_AND_INIT_CROP_JS % ("text-preview", "text-preview"),
-                )
-                text_thumb_strip.select(
-                    fn=_on_thumb_select,
-                    inputs=[text_results_state, text_metadata_state],
-                    outputs=[
-                        text_preview_image,
-                        text_preview_caption,
-                        text_selected_index_state,
-                        text_face_gallery,
-                        text_face_detections_state,
-                    ],
-                    js=REINIT_CROP_JS % "text-preview",
-                )
-                text_close_btn.click(
-                    fn=_on_close_preview,
-                    outputs=[
-                        text_preview_image,
-                        text_preview_caption,
-                        text_thumb_strip,
-                        text_close_btn,
-                        text_find_similar_btn,
-                        text_search_cropped_btn,
-                        text_copy_clipboard_btn,
-                        text_face_gallery,
-                        text_face_detections_state,
-                    ],
-                )
-                text_copy_clipboard_btn.click(
-                    fn=None,
-                    js=COPY_CLIPBOARD_JS % "text-preview",
-                )
+                text_tab = _build_search_tab("text", text_event_filter)
 
             # ── Tab 2: Image Search ──────────────────────────────────
             with gr.TabItem("Image Search", id=1):
@@ -946,274 +1192,43 @@ def create_app() -> gr.Blocks:
                     image_btn = gr.Button("Search Similar")
                     face_search_btn = gr.Button("Search Same Person", visible=False)
 
-                img_preview_image = gr.Image(
-                    label="Preview",
-                    visible=False,
-                    height=480,
-                    elem_id="img-preview",
-                )
-                img_preview_caption = gr.Markdown("", visible=False)
-                with gr.Row():
-                    img_find_similar_btn = gr.Button("Find Similar", visible=False)
-                    img_search_cropped_btn = gr.Button(
-                        "Search Cropped",
-                        visible=False,
-                        elem_id="img-search-cropped-btn",
-                    )
-                    img_copy_clipboard_btn = gr.Button(
-                        "Copy to Clipboard",
-                        visible=False,
-                        elem_id="img-copy-clipboard-btn",
-                    )
-                    img_close_btn = gr.Button("Close Preview", visible=False)
-                img_face_gallery = gr.Gallery(
-                    label="Detected Faces (click to find same person)",
-                    visible=False,
-                    rows=1,
-                    height=100,
-                    allow_preview=False,
-                    elem_classes=["thumb-strip"],
-                )
-                img_thumb_strip = gr.Gallery(
-                    label="",
-                    visible=False,
-                    rows=1,
-                    height=100,
-                    allow_preview=False,
-                    elem_classes=["thumb-strip"],
-                )
-
-                image_gallery = gr.Gallery(
-                    label="Results",
-                    columns=4,
-                    height="auto",
-                    allow_preview=False,
-                    elem_classes=["full-height-gallery"],
-                )
-                image_info = gr.Markdown("")
-                image_load_more_btn = gr.Button("Load More", visible=False)
-                img_crop_data = gr.Textbox(visible=False, elem_id="img-crop-data")
-
-                image_offset_state = gr.State(0)
-                image_results_state = gr.State([])
-                image_metadata_state = gr.State([])
-                image_embedding_state = gr.State(None)
-                image_selected_index_state = gr.State(None)
-                img_face_detections_state = gr.State([])
+                img_tab = _build_search_tab("img", image_event_filter)
                 face_embedding_state = gr.State(None)
 
-                def do_image_search(
-                    image_path: str | None,
-                    selected_events: list[str],
-                    model_choice: str,
-                ) -> tuple:
-                    if image_path is None:
-                        return (
-                            [],
-                            "Please upload an image.",
-                            0,
-                            [],
-                            [],
-                            None,
-                            gr.update(visible=False),
-                        )
-                    mc, model_name, embedder = _get_model_config(model_choice)
-                    query_emb = embedder.embed_images([Path(image_path)])
-                    results = search_images_by_text(
-                        mc,
-                        query_embedding=query_emb,
-                        model_name=model_name,
-                        limit=PAGE_SIZE,
-                        offset=0,
-                        event_names=selected_events or None,
-                    )
-                    gallery_items, metadata = _make_gallery_items(results)
-                    has_more = len(results) == PAGE_SIZE
-                    return (
-                        gallery_items,
-                        f"Found {len(results)} similar images.",
-                        PAGE_SIZE,
-                        gallery_items,
-                        metadata,
-                        query_emb.tolist(),
-                        gr.update(visible=has_more),
-                    )
-
-                def do_image_load_more(
-                    selected_events: list[str],
-                    offset: int,
-                    accumulated: list,
-                    accumulated_meta: list,
-                    query_emb_list,
-                    model_choice: str,
-                ) -> tuple:
-                    if query_emb_list is None:
-                        return (
-                            accumulated,
-                            "No active search.",
-                            offset,
-                            accumulated,
-                            accumulated_meta,
-                            gr.update(visible=False),
-                        )
-                    mc, model_name, _, edim = _get_model_config(model_choice)
-                    query_emb = np.array(query_emb_list)
-                    results = search_images_by_text(
-                        mc,
-                        query_embedding=query_emb,
-                        model_name=model_name,
-                        limit=PAGE_SIZE,
-                        offset=offset,
-                        event_names=selected_events or None,
-                        embedding_dim=edim,
-                    )
-                    new_items, new_meta = _make_gallery_items(results)
-                    combined = accumulated + new_items
-                    combined_meta = accumulated_meta + new_meta
-                    has_more = len(results) == PAGE_SIZE
-                    return (
-                        combined,
-                        f"Showing {len(combined)} images.",
-                        offset + len(results),
-                        combined,
-                        combined_meta,
-                        gr.update(visible=has_more),
-                    )
-
-                image_btn.click(
-                    fn=do_image_search,
-                    inputs=[image_input, image_event_filter, model_selector],
-                    outputs=[
-                        image_gallery,
-                        image_info,
-                        image_offset_state,
-                        image_results_state,
-                        image_metadata_state,
-                        image_embedding_state,
-                        image_load_more_btn,
-                    ],
-                ).then(
-                    fn=_on_close_preview,
-                    outputs=[
-                        img_preview_image,
-                        img_preview_caption,
-                        img_thumb_strip,
-                        img_close_btn,
-                        img_find_similar_btn,
-                        img_search_cropped_btn,
-                        img_copy_clipboard_btn,
-                        img_face_gallery,
-                        img_face_detections_state,
-                    ],
-                ).then(
-                    fn=lambda: (None, gr.update(visible=False)),
-                    outputs=[face_embedding_state, face_search_btn],
-                )
-                image_load_more_btn.click(
-                    fn=do_image_load_more,
-                    inputs=[
-                        image_event_filter,
-                        image_offset_state,
-                        image_results_state,
-                        image_metadata_state,
-                        image_embedding_state,
-                        model_selector,
-                    ],
-                    outputs=[
-                        image_gallery,
-                        image_info,
-                        image_offset_state,
-                        image_results_state,
-                        image_metadata_state,
-                        image_load_more_btn,
-                    ],
-                )
-                image_gallery.select(
-                    fn=_on_gallery_select,
-                    inputs=[image_results_state, image_metadata_state],
-                    outputs=[
-                        img_preview_image,
-                        img_preview_caption,
-                        img_thumb_strip,
-                        img_close_btn,
-                        img_find_similar_btn,
-                        img_search_cropped_btn,
-                        img_copy_clipboard_btn,
-                        image_selected_index_state,
-                        img_face_gallery,
-                        img_face_detections_state,
-                    ],
-                    js=SCROLL_AND_INIT_CROP_JS % ("img-preview", "img-preview"),
-                )
-                img_thumb_strip.select(
-                    fn=_on_thumb_select,
-                    inputs=[image_results_state, image_metadata_state],
-                    outputs=[
-                        img_preview_image,
-                        img_preview_caption,
-                        image_selected_index_state,
-                        img_face_gallery,
-                        img_face_detections_state,
-                    ],
-                    js=REINIT_CROP_JS % "img-preview",
-                )
-                img_close_btn.click(
-                    fn=_on_close_preview,
-                    outputs=[
-                        img_preview_image,
-                        img_preview_caption,
-                        img_thumb_strip,
-                        img_close_btn,
-                        img_find_similar_btn,
-                        img_search_cropped_btn,
-                        img_copy_clipboard_btn,
-                        img_face_gallery,
-                        img_face_detections_state,
-                    ],
-                )
-                img_copy_clipboard_btn.click(
-                    fn=None,
-                    js=COPY_CLIPBOARD_JS % "img-preview",
-                )
+        # ── Search buttons ───────────────────────────────────────────
+        text_btn.click(
+            fn=do_text_search,
+            inputs=[text_input, text_event_filter, model_selector],
+            outputs=text_tab.search_outputs + text_tab.close_outputs,
+        )
+        image_btn.click(
+            fn=do_image_search,
+            inputs=[image_input, image_event_filter, model_selector],
+            outputs=img_tab.search_outputs
+            + img_tab.close_outputs
+            + [face_embedding_state, face_search_btn],
+        )
 
         # ── Close previews on tab switch ─────────────────────────────
-        def _on_tab_switch():
-            close = _on_close_preview()
-            return close + close  # both tabs
-
+        # The handler returns a frozen constant, so the only user-visible
+        # cost is Gradio's progress overlay flashing over the galleries on
+        # every switch — suppress it.
         tabs.select(
             fn=_on_tab_switch,
-            outputs=[
-                text_preview_image,
-                text_preview_caption,
-                text_thumb_strip,
-                text_close_btn,
-                text_find_similar_btn,
-                text_search_cropped_btn,
-                text_copy_clipboard_btn,
-                text_face_gallery,
-                text_face_detections_state,
-                img_preview_image,
-                img_preview_caption,
-                img_thumb_strip,
-                img_close_btn,
-                img_find_similar_btn,
-                img_search_cropped_btn,
-                img_copy_clipboard_btn,
-                img_face_gallery,
-                img_face_detections_state,
-            ],
+            outputs=text_tab.close_outputs + img_tab.close_outputs,
+            show_progress="hidden",
         )
 
         # ── Cross-tab wiring (Find Similar / Search Cropped / Face Search) ──
+        # All three flows land their results in the Image Search tab.
         _find_similar_outputs = [
-            image_gallery,
-            image_info,
-            image_offset_state,
-            image_results_state,
-            image_metadata_state,
-            image_embedding_state,
-            image_load_more_btn,
+            img_tab.gallery,
+            img_tab.info,
+            img_tab.offset_state,
+            img_tab.results_state,
+            img_tab.metadata_state,
+            img_tab.embedding_state,
+            img_tab.load_more_btn,
             image_event_filter,
             image_input,
             tabs,
@@ -1221,99 +1236,42 @@ def create_app() -> gr.Blocks:
             face_search_btn,
         ]
 
-        _text_close_outputs = [
-            text_preview_image,
-            text_preview_caption,
-            text_thumb_strip,
-            text_close_btn,
-            text_find_similar_btn,
-            text_search_cropped_btn,
-            text_copy_clipboard_btn,
-            text_face_gallery,
-            text_face_detections_state,
-        ]
-        _img_close_outputs = [
-            img_preview_image,
-            img_preview_caption,
-            img_thumb_strip,
-            img_close_btn,
-            img_find_similar_btn,
-            img_search_cropped_btn,
-            img_copy_clipboard_btn,
-            img_face_gallery,
-            img_face_detections_state,
-        ]
-
-        text_find_similar_btn.click(
-            fn=_do_find_similar,
-            inputs=[
-                text_selected_index_state,
-                text_metadata_state,
-                text_event_filter,
-                model_selector,
-            ],
-            outputs=_find_similar_outputs,
-        ).then(
-            fn=_on_close_preview,
-            outputs=_text_close_outputs,
-        )
-        img_find_similar_btn.click(
-            fn=_do_find_similar,
-            inputs=[
-                image_selected_index_state,
-                image_metadata_state,
-                image_event_filter,
-                model_selector,
-            ],
-            outputs=_find_similar_outputs,
-        ).then(
-            fn=_on_close_preview,
-            outputs=_img_close_outputs,
-        )
-
-        # Search Cropped: JS extracts crop rect → JSON → Python fetches & crops
-        text_search_cropped_btn.click(
-            fn=None,
-            js=CROP_TO_JSON_JS % "text-preview",
-            outputs=[text_crop_data],
-        ).then(
-            fn=_do_search_cropped,
-            inputs=[text_crop_data, text_event_filter, model_selector],
-            outputs=_find_similar_outputs,
-        ).then(
-            fn=_on_close_preview,
-            outputs=_text_close_outputs,
-        )
-        img_search_cropped_btn.click(
-            fn=None,
-            js=CROP_TO_JSON_JS % "img-preview",
-            outputs=[img_crop_data],
-        ).then(
-            fn=_do_search_cropped,
-            inputs=[img_crop_data, image_event_filter, model_selector],
-            outputs=_find_similar_outputs,
-        ).then(
-            fn=_on_close_preview,
-            outputs=_img_close_outputs,
-        )
-
-        # Face Search: click face thumbnail → find same person
-        text_face_gallery.select(
-            fn=_do_face_search,
-            inputs=[text_face_detections_state, text_event_filter, text_face_gallery],
-            outputs=_find_similar_outputs,
-        ).then(
-            fn=_on_close_preview,
-            outputs=_text_close_outputs,
-        )
-        img_face_gallery.select(
-            fn=_do_face_search,
-            inputs=[img_face_detections_state, image_event_filter, img_face_gallery],
-            outputs=_find_similar_outputs,
-        ).then(
-            fn=_on_close_preview,
-            outputs=_img_close_outputs,
-        )
+        for tab in (text_tab, img_tab):
+            tab.find_similar_btn.click(
+                fn=_do_find_similar,
+                inputs=[
+                    tab.selected_index_state,
+                    tab.metadata_state,
+                    tab.event_filter,
+                    model_selector,
+                ],
+                outputs=_find_similar_outputs,
+            ).then(
+                fn=_on_close_preview,
+                outputs=tab.close_outputs,
+            )
+            # Search Cropped: JS extracts crop rect → JSON → Python fetches & crops
+            tab.search_cropped_btn.click(
+                fn=None,
+                js=CROP_TO_JSON_JS % tab.preview_id,
+                outputs=[tab.crop_data],
+            ).then(
+                fn=_do_search_cropped,
+                inputs=[tab.crop_data, tab.event_filter, model_selector],
+                outputs=_find_similar_outputs,
+            ).then(
+                fn=_on_close_preview,
+                outputs=tab.close_outputs,
+            )
+            # Face Search: click face thumbnail → find same person
+            tab.face_gallery.select(
+                fn=_do_face_search,
+                inputs=[tab.face_detections_state, tab.event_filter, tab.face_gallery],
+                outputs=_find_similar_outputs,
+            ).then(
+                fn=_on_close_preview,
+                outputs=tab.close_outputs,
+            )
 
         # Re-search by stored face embedding
         face_search_btn.click(
@@ -1322,7 +1280,11 @@ def create_app() -> gr.Blocks:
             outputs=_find_similar_outputs,
         ).then(
             fn=_on_close_preview,
-            outputs=_img_close_outputs,
+            outputs=img_tab.close_outputs,
         )
 
+    # Warm the embedders in the background so the first search is not blocked
+    # by model download/weight loading.
+    threading.Thread(target=_warm_embedders, daemon=True).start()
+
     return app
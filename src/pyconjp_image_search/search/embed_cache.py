@@ -0,0 +1,48 @@
+"""Thread-safe LRU cache with TTL for query embeddings."""
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LRUEmbeddingCache[V = np.ndarray]:
+    """LRU cache mapping hashable keys to embedding values, with per-entry TTL.
+
+    Query distributions are heavily skewed toward a few popular searches, so a
+    small cache avoids most repeated model forward passes. The value type
+    defaults to a bare embedding array but can carry composite payloads (e.g.
+    an embedding together with the crop file it came from).
+    """
+
+    def __init__(self, capacity: int = 1024, ttl: float = 3600.0) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[tuple, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: tuple) -> V | None:
+        """Return the cached value for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, embedding = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, key: tuple, embedding: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -3,14 +3,33 @@
 import duckdb
 import numpy as np
 
-from pyconjp_image_search.manager.repository import _row_to_metadata
 from pyconjp_image_search.models import ImageMetadata
+from pyconjp_image_search.search.matrix import get_embedding_matrix
 
 
 def get_event_names(conn: duckdb.DuckDBPyConnection) -> list[str]:
-    """Get distinct event names from the database."""
-    rows = conn.execute("SELECT DISTINCT event_name FROM images ORDER BY event_name").fetchall()
-    return [row[0] for row in rows]
+    """Get distinct event names from the database.
+
+    Reads the events reference table the ingest path maintains — a handful
+    of rows instead of a DISTINCT aggregate over every image. Databases from
+    before that table existed may be opened read-only (so ensure_schema could
+    not create/backfill it); those fall back to the scan.
+    """
+    # array_agg returns the whole result as one Python list in a single-row
+    # fetch, instead of N one-tuples that each need unpacking.
+    try:
+        row = conn.execute(
+            "SELECT array_agg(event_name ORDER BY event_name) FROM events"
+        ).fetchone()
+        names = row[0] if row else None
+    except duckdb.CatalogException:
+        names = None
+    if not names:
+        row = conn.execute(
+            "SELECT array_agg(DISTINCT event_name ORDER BY event_name) FROM images"
+        ).fetchone()
+        names = row[0] if row else None
+    return names or []
 
 
 def get_image_embedding(
@@ -37,34 +56,30 @@ def search_images_by_text(
     event_names: list[str] | None = None,
     embedding_dim: int = 768,
 ) -> list[tuple[ImageMetadata, float]]:
-    """Search images by cosine similarity to a text embedding."""
-    query_vec = query_embedding.flatten().tolist()
-    params: list = [query_vec, model_name]
+    """Search images by cosine similarity to a text embedding.
+
+    Scoring runs against an in-memory embedding matrix (one BLAS matmul over
+    all rows) instead of a per-row cosine scan inside DuckDB; see
+    :mod:`pyconjp_image_search.search.matrix`.
+    """
+    emb_matrix = get_embedding_matrix(conn, model_name)
+    return emb_matrix.search(query_embedding, limit=limit, offset=offset, event_names=event_names)
 
-    where_clauses = ["e.model_name = ?"]
-    if event_names:
-        placeholders = ", ".join(["?"] * len(event_names))
-        where_clauses.append(f"i.event_name IN ({placeholders})")
-        params.extend(event_names)
 
-    where_sql = " AND ".join(where_clauses)
-    params.extend([limit, offset])
+def search_images_by_text_batch(
+    conn: duckdb.DuckDBPyConnection,
+    query_embeddings: np.ndarray,
+    model_name: str,
+    limit: int = 20,
+    offset: int = 0,
+    event_names: list[str] | None = None,
+) -> list[list[tuple[ImageMetadata, float]]]:
+    """Search images for a batch of query embeddings with one matmul.
 
-    rows = conn.execute(
-        f"""
-        SELECT i.*, list_cosine_similarity(e.embedding, ?::FLOAT[{embedding_dim}]) AS score
-        FROM image_embeddings e
-        JOIN images i ON i.id = e.image_id
-        WHERE {where_sql}
-        ORDER BY score DESC
-        LIMIT ?
-        OFFSET ?
-        """,
-        params,
-    ).fetchall()
-    results = []
-    for row in rows:
-        score = row[-1]
-        meta = _row_to_metadata(row[:-1])
-        results.append((meta, score))
-    return results
+    Call sites that fan out several queries at once (e.g. one per detected
+    face) pay a single GEMM instead of B sequential GEMV sweeps.
+    """
+    emb_matrix = get_embedding_matrix(conn, model_name)
+    return emb_matrix.batch_search(
+        query_embeddings, limit=limit, offset=offset, event_names=event_names
+    )
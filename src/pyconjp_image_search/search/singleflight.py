@@ -0,0 +1,38 @@
+"""Coalesce concurrent identical calls into a single execution."""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share it.
+
+    The first caller for a key becomes the owner and executes the function;
+    callers that arrive while it is in flight block on the same Future and
+    receive the owner's result (or exception). Once the call finishes the key
+    is cleared, so later calls execute afresh.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call fn(*args, **kwargs), deduplicating concurrent calls by key."""
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if owner:
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+        return future.result()
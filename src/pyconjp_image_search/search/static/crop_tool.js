@@ -0,0 +1,256 @@
+/* Crop tool for the preview image: rectangle selection overlay plus helpers
+ * used by the Gradio event JS (initCrop / getCropData / _toast). */
+
+window._cropStates = {};
+
+/* Pooled scratch objects for clipboard copies: one canvas and one
+ * CORS-enabled image, resized/reused per copy. A fresh full-size canvas per
+ * click is a multi-MB allocation spike, and reusing the image keeps the
+ * decoded bitmap warm when the same preview is copied twice. */
+window._cropCanvas = document.createElement('canvas');
+window._cropCorsImg = new Image();
+window._cropCorsImg.crossOrigin = 'anonymous';
+
+/* Mark result-gallery tiles lazy: with four columns the grid puts most of a
+ * page below the fold, and without the hint the browser downloads and
+ * decodes every tile eagerly. Gradio re-renders tiles on each update, so a
+ * MutationObserver tags new <img> nodes as they appear. */
+(function() {
+    var SCOPES = '.full-height-gallery img, .thumb-strip img';
+    function lazify(node) {
+        if (node.tagName === 'IMG') {
+            if (node.closest('.full-height-gallery, .thumb-strip')) {
+                node.loading = 'lazy';
+                node.decoding = 'async';
+            }
+            return;
+        }
+        if (node.querySelectorAll) {
+            node.querySelectorAll(SCOPES).forEach(function(img) {
+                img.loading = 'lazy';
+                img.decoding = 'async';
+            });
+        }
+    }
+    function start() {
+        lazify(document.body);
+        new MutationObserver(function(mutations) {
+            mutations.forEach(function(m) {
+                m.addedNodes.forEach(function(n) {
+                    if (n.nodeType === 1) lazify(n);
+                });
+            });
+        }).observe(document.body, {childList: true, subtree: true});
+    }
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start);
+    } else {
+        start();
+    }
+})();
+
+window._toast = function(msg, ok) {
+    var t = document.createElement('div');
+    t.textContent = msg;
+    t.style.cssText = 'position:fixed;top:20px;left:50%;transform:translateX(-50%);'
+        + 'background:' + (ok ? '#333' : '#c00') + ';color:#fff;padding:12px 24px;'
+        + 'border-radius:8px;z-index:9999;font-size:14px;box-shadow:0 2px 8px rgba(0,0,0,.3);';
+    document.body.appendChild(t);
+    setTimeout(function(){ t.remove(); }, 2000);
+};
+
+/* Compute the actual rendered image rect inside an object-fit:contain element.
+ * object-fit never changes at runtime here, so the getComputedStyle result is
+ * memoized on the element — style resolution is forced once per image instead
+ * of once per call (which during a drag meant once per frame). */
+function _objectFit(img) {
+    if (!img._cropFit) {
+        img._cropFit = window.getComputedStyle(img).objectFit || 'fill';
+    }
+    return img._cropFit;
+}
+
+function _getRenderedRect(img) {
+    var ir = img.getBoundingClientRect();
+    var natW = img.naturalWidth;
+    var natH = img.naturalHeight;
+    if (!natW || !natH) return ir;
+    var fit = _objectFit(img);
+    if (fit === 'contain' || fit === 'scale-down') {
+        var ratio = Math.min(ir.width / natW, ir.height / natH);
+        var rw = natW * ratio;
+        var rh = natH * ratio;
+        return {
+            left: ir.left + (ir.width - rw) / 2,
+            top: ir.top + (ir.height - rh) / 2,
+            width: rw,
+            height: rh
+        };
+    }
+    return { left: ir.left, top: ir.top, width: ir.width, height: ir.height };
+}
+
+/* Enable / disable the crop-dependent buttons */
+function _setCropBtns(containerId, enabled) {
+    var prefix = (containerId === 'text-preview') ? 'text' : 'img';
+    ['search-cropped-btn', 'copy-clipboard-btn'].forEach(function(suffix) {
+        var el = document.getElementById(prefix + '-' + suffix);
+        if (!el) return;
+        /* Gradio 6: elem_id may be on the <button> itself or on a wrapper */
+        var btn = (el.tagName === 'BUTTON') ? el : el.querySelector('button');
+        if (!btn) btn = el;
+        btn.disabled = !enabled;
+        btn.style.opacity = enabled ? '' : '0.4';
+        btn.style.pointerEvents = enabled ? '' : 'none';
+    });
+}
+
+/* Set up the rectangle-selection overlay on the preview image */
+function _setupOverlay(container, img, containerId) {
+    var wrapper = img.parentElement;
+    if (!wrapper) return;
+    wrapper.style.position = 'relative';
+
+    var overlay = document.createElement('div');
+    overlay.className = 'crop-overlay';
+    var sel = document.createElement('div');
+    sel.className = 'crop-selection';
+    sel.style.display = 'none';
+    wrapper.appendChild(overlay);
+    wrapper.appendChild(sel);
+
+    var st = {active:false, sx:0, sy:0, ex:0, ey:0, has:false, _raf:0, _mx:0, _my:0};
+    window._cropStates[containerId] = st;
+
+    /* Disable buttons until a rectangle is drawn */
+    _setCropBtns(containerId, false);
+
+    /* The rendered rect (and the natural dims it derives from) only changes
+     * on scroll/resize, so it is cached across drag frames and dropped when
+     * either fires. Stale closures from a re-initialized overlay only reset
+     * their own dead cache. */
+    var cachedRect = null;
+    function invalidateRect() { cachedRect = null; }
+    window.addEventListener('scroll', invalidateRect, {passive:true, capture:true});
+    window.addEventListener('resize', invalidateRect, {passive:true});
+    function getRect() {
+        if (!cachedRect) cachedRect = _getRenderedRect(img);
+        return cachedRect;
+    }
+
+    /* Apply the last seen pointer position. The rendered rect is computed
+     * once here and reused by _updateSel, so a frame does a single
+     * getBoundingClientRect instead of two. */
+    function applyMove() {
+        var rr = getRect();
+        st.ex = Math.max(0, Math.min(st._mx - rr.left, rr.width));
+        st.ey = Math.max(0, Math.min(st._my - rr.top, rr.height));
+        _updateSel(sel, st, img, rr);
+    }
+
+    overlay.addEventListener('mousedown', function(e) {
+        e.preventDefault();
+        var rr = getRect();
+        var x = e.clientX - rr.left;
+        var y = e.clientY - rr.top;
+        if (x < 0 || y < 0 || x > rr.width || y > rr.height) return;
+        st.active = true;
+        st.sx = x; st.sy = y; st.ex = x; st.ey = y;
+        st.has = false;
+        sel.style.display = 'block';
+        _updateSel(sel, st, img, rr);
+        _setCropBtns(containerId, false);
+    });
+    /* Listeners stay on document so a drag keeps tracking when the pointer
+     * leaves the image; mousemove only records coords and coalesces the
+     * layout reads + style writes into one rAF callback per frame. */
+    document.addEventListener('mousemove', function(e) {
+        if (!st.active) return;
+        st._mx = e.clientX;
+        st._my = e.clientY;
+        if (!st._raf) {
+            st._raf = requestAnimationFrame(function() {
+                st._raf = 0;
+                if (st.active) applyMove();
+            });
+        }
+    }, {passive:true});
+    document.addEventListener('mouseup', function() {
+        if (!st.active) return;
+        st.active = false;
+        if (st._raf) {
+            /* Flush the pending frame so the final rect uses the last coords */
+            cancelAnimationFrame(st._raf);
+            st._raf = 0;
+            applyMove();
+        }
+        var w = Math.abs(st.ex - st.sx), h = Math.abs(st.ey - st.sy);
+        st.has = (w > 5 && h > 5);
+        if (!st.has) sel.style.display = 'none';
+        _setCropBtns(containerId, st.has);
+    }, {passive:true});
+}
+
+/* Position the selection div accounting for image offset inside wrapper.
+ * Callers that already computed the rendered rect pass it as `rr`. */
+function _updateSel(el, s, img, rr) {
+    var wr = img.parentElement.getBoundingClientRect();
+    rr = rr || _getRenderedRect(img);
+    var offX = rr.left - wr.left;
+    var offY = rr.top  - wr.top;
+    var x = Math.min(s.sx, s.ex) + offX;
+    var y = Math.min(s.sy, s.ey) + offY;
+    var w = Math.abs(s.ex - s.sx);
+    var h = Math.abs(s.ey - s.sy);
+    el.style.left = x + 'px'; el.style.top = y + 'px';
+    el.style.width = w + 'px'; el.style.height = h + 'px';
+}
+
+window.initCrop = function(containerId, retries) {
+    retries = retries || 0;
+    var container = document.getElementById(containerId);
+    if (!container) return;
+
+    /* Clean up previous overlay */
+    container.querySelectorAll('.crop-overlay,.crop-selection')
+             .forEach(function(e){ e.remove(); });
+
+    var img = container.querySelector('img');
+    if (!img || !img.src) {
+        if (retries < 15) {
+            setTimeout(function() { window.initCrop(containerId, retries + 1); }, 200);
+        }
+        return;
+    }
+
+    if (img.complete && img.naturalWidth > 0) {
+        _setupOverlay(container, img, containerId);
+    } else {
+        img.addEventListener('load', function onload() {
+            img.removeEventListener('load', onload);
+            _setupOverlay(container, img, containerId);
+        });
+    }
+};
+
+/* Get crop data as JSON string (image URL + crop rect in natural pixels) */
+window.getCropData = function(containerId) {
+    var container = document.getElementById(containerId);
+    if (!container) return null;
+    var img = container.querySelector('img');
+    if (!img) return null;
+    var st = window._cropStates[containerId];
+    if (!st || !st.has) return null;
+
+    var rr = _getRenderedRect(img);
+    var scX = img.naturalWidth  / rr.width;
+    var scY = img.naturalHeight / rr.height;
+
+    return JSON.stringify({
+        url: img.src,
+        x: Math.round(Math.min(st.sx, st.ex) * scX),
+        y: Math.round(Math.min(st.sy, st.ey) * scY),
+        w: Math.round(Math.abs(st.ex - st.sx) * scX),
+        h: Math.round(Math.abs(st.ey - st.sy) * scY)
+    });
+};
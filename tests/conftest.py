@@ -3,21 +3,103 @@
 from datetime import UTC, datetime
 
 import duckdb
+import numpy as np
 import pytest
 
+from pyconjp_image_search.embedding.repository import insert_embeddings
+from pyconjp_image_search.manager.repository import insert_images
 from pyconjp_image_search.manager.schema import ensure_schema
 from pyconjp_image_search.models import ImageMetadata
+from pyconjp_image_search.search.matrix import _l2_normalize_rows, _matrix_cache
 
+# The embedding code is dimension-agnostic (ensure_schema takes the dim and
+# cosine with self is 1.0 at any width), so correctness tests run on narrow
+# vectors instead of paying 3 KB of float32 per 768-wide row. Tests that
+# assert the production shape pass dim=768 explicitly on their own schema.
+TEST_EMBED_DIM = 16
 
-@pytest.fixture
-def db_conn():
-    """In-memory DuckDB connection with schema initialized."""
+
+@pytest.fixture(scope="session")
+def _session_conn():
+    """One in-memory DuckDB for the whole session, schema created once."""
     conn = duckdb.connect(":memory:")
-    ensure_schema(conn)
+    ensure_schema(conn, embedding_dim=TEST_EMBED_DIM)
     yield conn
     conn.close()
 
 
+@pytest.fixture
+def db_conn(_session_conn):
+    """Session connection wrapped in a per-test transaction.
+
+    Each test's writes are rolled back afterwards, so tests stay isolated
+    without paying for a fresh connection plus ensure_schema every time.
+    The embedding-matrix cache is keyed by connection with a row-count
+    staleness check, which a rollback can fool (same count, different
+    rows), so the connection's cache entry is dropped on teardown.
+    """
+    _session_conn.execute("BEGIN TRANSACTION")
+    try:
+        yield _session_conn
+    finally:
+        _session_conn.execute("ROLLBACK")
+        _matrix_cache.pop(_session_conn, None)
+
+
+# Row count of the shared embedding pool; covers every size the tests ask for.
+_EMBED_POOL_ROWS = 8
+
+
+@pytest.fixture(scope="session")
+def normalized_embeddings():
+    """Factory for unit-normalized random embeddings, pooled per session.
+
+    One (_EMBED_POOL_ROWS, dim) array is generated and normalized per
+    (dim, seed); every requested size is a zero-copy row slice of it, so
+    the suite pays for the RNG and normalization once regardless of how
+    many shapes the tests ask for. Callers must treat the returned array
+    as read-only (insert_embeddings and the search paths do not mutate
+    their input).
+    """
+    pools: dict[tuple[int, int], np.ndarray] = {}
+
+    def _make(n: int, dim: int = TEST_EMBED_DIM, seed: int = 42) -> np.ndarray:
+        key = (dim, seed)
+        pool = pools.get(key)
+        if pool is None or pool.shape[0] < n:
+            rng = np.random.default_rng(seed)
+            emb = rng.standard_normal((max(n, _EMBED_POOL_ROWS), dim), dtype=np.float32)
+            pool = pools[key] = _l2_normalize_rows(emb)
+        return pool[:n]
+
+    return _make
+
+
+@pytest.fixture
+def populated_db(db_conn, normalized_embeddings):
+    """Factory that inserts n images with matching embeddings.
+
+    The search tests all share the same insert-images / fetch-ids /
+    insert-embeddings preamble; this collapses it to one call. Returns
+    (image_ids, embeddings); pass metas for rows that need specific
+    event names.
+    """
+
+    def _populate(
+        n: int,
+        metas: list[ImageMetadata] | None = None,
+        model: str = "test-model",
+    ) -> tuple[list[int], np.ndarray]:
+        if metas is None:
+            metas = [make_metadata(str(i + 1)) for i in range(n)]
+        image_ids = insert_images(db_conn, metas)
+        embeddings = normalized_embeddings(n)
+        insert_embeddings(db_conn, image_ids, embeddings, model)
+        return image_ids, embeddings
+
+    return _populate
+
+
 @pytest.fixture
 def sample_metadata() -> ImageMetadata:
     """A single ImageMetadata fixture."""
@@ -0,0 +1,37 @@
+"""Tests for the query-embedding LRU cache."""
+
+import numpy as np
+
+from pyconjp_image_search.search.embed_cache import LRUEmbeddingCache
+
+
+def test_get_miss_returns_none():
+    cache = LRUEmbeddingCache(capacity=4)
+    assert cache.get(("model", "query")) is None
+
+
+def test_put_and_get_roundtrip():
+    cache = LRUEmbeddingCache(capacity=4)
+    emb = np.ones((1, 768), dtype=np.float32)
+    cache.put(("model", "keynote"), emb)
+    result = cache.get(("model", "keynote"))
+    assert result is emb
+
+
+def test_capacity_evicts_least_recently_used():
+    cache = LRUEmbeddingCache(capacity=2)
+    a = np.zeros((1, 4), dtype=np.float32)
+    cache.put(("m", "a"), a)
+    cache.put(("m", "b"), a)
+    cache.get(("m", "a"))  # refresh "a"
+    cache.put(("m", "c"), a)  # evicts "b"
+    assert cache.get(("m", "a")) is not None
+    assert cache.get(("m", "b")) is None
+    assert cache.get(("m", "c")) is not None
+    assert len(cache) == 2
+
+
+def test_ttl_expiry():
+    cache = LRUEmbeddingCache(capacity=4, ttl=0.0)
+    cache.put(("m", "a"), np.zeros(4, dtype=np.float32))
+    assert cache.get(("m", "a")) is None
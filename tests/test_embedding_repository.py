@@ -1,7 +1,7 @@
 """Tests for embedding repository CRUD operations."""
 
 import numpy as np
-from conftest import make_metadata
+from conftest import TEST_EMBED_DIM, make_metadata
 
 from pyconjp_image_search.embedding.repository import (
     get_embedding_stats,
@@ -9,30 +9,18 @@ from pyconjp_image_search.embedding.repository import (
     insert_embeddings,
     search_by_embedding,
 )
-from pyconjp_image_search.manager.repository import insert_image
+from pyconjp_image_search.manager.repository import insert_images
 
 MODEL = "test-model"
 
 
 def _insert_test_images(db_conn, count=3):
     """Insert test images and return their IDs."""
-    for i in range(count):
-        meta = make_metadata(str(1000 + i))
-        insert_image(db_conn, meta)
-    rows = db_conn.execute("SELECT id FROM images ORDER BY id").fetchall()
-    return [row[0] for row in rows]
+    return insert_images(db_conn, [make_metadata(str(1000 + i)) for i in range(count)])
 
 
-def test_insert_and_search_embeddings(db_conn):
-    image_ids = _insert_test_images(db_conn, 3)
-
-    # Create normalized embeddings
-    rng = np.random.default_rng(42)
-    embeddings = rng.standard_normal((3, 768)).astype(np.float32)
-    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-    embeddings = embeddings / norms
-
-    insert_embeddings(db_conn, image_ids, embeddings, MODEL)
+def test_insert_and_search_embeddings(db_conn, populated_db):
+    image_ids, embeddings = populated_db(3, model=MODEL)
 
     # Search with the first embedding — should return itself as top result
     results = search_by_embedding(db_conn, embeddings[0:1], MODEL, limit=3)
@@ -44,8 +32,7 @@ def test_insert_and_search_embeddings(db_conn):
 
 def test_insert_embeddings_idempotent(db_conn):
     image_ids = _insert_test_images(db_conn, 1)
-    emb = np.ones((1, 768), dtype=np.float32)
-    emb = emb / np.linalg.norm(emb)
+    emb = np.ones((1, TEST_EMBED_DIM), dtype=np.float32)
 
     insert_embeddings(db_conn, image_ids, emb, MODEL)
     insert_embeddings(db_conn, image_ids, emb, MODEL)  # Should not raise
@@ -58,7 +45,7 @@ def test_get_unembedded_image_ids(db_conn):
     image_ids = _insert_test_images(db_conn, 3)
 
     # Embed only the first image
-    emb = np.ones((1, 768), dtype=np.float32)
+    emb = np.ones((1, TEST_EMBED_DIM), dtype=np.float32)
     insert_embeddings(db_conn, [image_ids[0]], emb, MODEL)
 
     unembedded = get_unembedded_image_ids(db_conn, MODEL)
@@ -74,7 +61,7 @@ def test_get_embedding_stats(db_conn):
     assert total == 5
     assert embedded == 0
 
-    emb = np.ones((2, 768), dtype=np.float32)
+    emb = np.ones((2, TEST_EMBED_DIM), dtype=np.float32)
     insert_embeddings(db_conn, image_ids[:2], emb, MODEL)
 
     total, embedded = get_embedding_stats(db_conn, MODEL)
@@ -3,9 +3,12 @@
 from conftest import make_metadata
 
 from pyconjp_image_search.manager.repository import (
+    _row_to_metadata,
+    _row_to_metadata_fast,
     get_existing_photo_ids,
     get_image_by_url,
     insert_image,
+    insert_images,
     list_images,
 )
 
@@ -27,9 +30,14 @@ def test_insert_duplicate_ignored(db_conn, sample_metadata):
 
 
 def test_list_images_filter_by_event(db_conn):
-    insert_image(db_conn, make_metadata("1", event_name="PyCon JP", event_year=2024))
-    insert_image(db_conn, make_metadata("2", event_name="PyCon JP", event_year=2025))
-    insert_image(db_conn, make_metadata("3", event_name="PyCon US", event_year=2024))
+    insert_images(
+        db_conn,
+        [
+            make_metadata("1", event_name="PyCon JP", event_year=2024),
+            make_metadata("2", event_name="PyCon JP", event_year=2025),
+            make_metadata("3", event_name="PyCon US", event_year=2024),
+        ],
+    )
 
     results = list_images(db_conn, event_name="PyCon JP")
     assert len(results) == 2
@@ -41,10 +49,23 @@ def test_list_images_filter_by_event(db_conn):
     assert len(results) == 1
 
 
+def test_row_to_metadata_fast_matches_slow_path(db_conn, sample_metadata):
+    # The fast converter relies on ImageMetadata declaring its fields in
+    # images-table column order; a real row must produce identical objects.
+    insert_image(db_conn, sample_metadata)
+    row = db_conn.execute("SELECT * FROM images").fetchone()
+    assert _row_to_metadata_fast(row) == _row_to_metadata(row)
+
+
 def test_get_existing_photo_ids(db_conn):
-    insert_image(db_conn, make_metadata("100", album_id="a1"))
-    insert_image(db_conn, make_metadata("200", album_id="a1"))
-    insert_image(db_conn, make_metadata("300", album_id="a2"))
+    insert_images(
+        db_conn,
+        [
+            make_metadata("100", album_id="a1"),
+            make_metadata("200", album_id="a1"),
+            make_metadata("300", album_id="a2"),
+        ],
+    )
 
     ids = get_existing_photo_ids(db_conn, album_id="a1")
     assert ids == {"100", "200"}
@@ -1,14 +1,18 @@
 """Tests for search query functions."""
 
+import duckdb
 import numpy as np
-from conftest import make_metadata
+import pytest
+from conftest import TEST_EMBED_DIM, make_metadata
 
 from pyconjp_image_search.embedding.repository import insert_embeddings
-from pyconjp_image_search.manager.repository import insert_image
+from pyconjp_image_search.manager.repository import insert_image, insert_images
+from pyconjp_image_search.manager.schema import ensure_schema
 from pyconjp_image_search.search.query import (
     get_event_names,
     get_image_embedding,
     search_images_by_text,
+    search_images_by_text_batch,
 )
 
 
@@ -20,66 +24,71 @@ def test_get_event_names(db_conn):
     assert names == ["PyCon JP", "PyCon US"]
 
 
-def test_get_image_embedding(db_conn):
-    insert_image(db_conn, make_metadata("1"))
-    image_ids = [row[0] for row in db_conn.execute("SELECT id FROM images ORDER BY id").fetchall()]
+@pytest.mark.parametrize("dim", [TEST_EMBED_DIM, 768])
+def test_get_image_embedding(normalized_embeddings, dim):
+    # Round-trip the stored shape at both the test dim and the production
+    # 768, each on a schema created for that width.
+    conn = duckdb.connect(":memory:")
+    ensure_schema(conn, embedding_dim=dim)
+    image_ids = insert_images(conn, [make_metadata("1")])
 
-    rng = np.random.default_rng(42)
-    embeddings = rng.standard_normal((1, 768)).astype(np.float32)
-    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-    embeddings = embeddings / norms
+    embeddings = normalized_embeddings(1, dim=dim)
 
     model = "test-model"
-    insert_embeddings(db_conn, image_ids, embeddings, model)
+    insert_embeddings(conn, image_ids, embeddings, model)
 
     # Existing embedding
-    result = get_image_embedding(db_conn, image_ids[0], model)
+    result = get_image_embedding(conn, image_ids[0], model)
     assert result is not None
-    assert result.shape == (768,)
+    assert result.shape == (dim,)
     np.testing.assert_allclose(result, embeddings[0], atol=1e-6)
 
     # Non-existent image
-    assert get_image_embedding(db_conn, 9999, model) is None
+    assert get_image_embedding(conn, 9999, model) is None
 
     # Non-existent model
-    assert get_image_embedding(db_conn, image_ids[0], "no-model") is None
+    assert get_image_embedding(conn, image_ids[0], "no-model") is None
+    conn.close()
 
 
-def test_search_images_by_text_cosine(db_conn):
-    # Insert images
-    insert_image(db_conn, make_metadata("1"))
-    insert_image(db_conn, make_metadata("2"))
-    image_ids = [row[0] for row in db_conn.execute("SELECT id FROM images ORDER BY id").fetchall()]
-
-    # Insert embeddings
-    rng = np.random.default_rng(42)
-    embeddings = rng.standard_normal((2, 768)).astype(np.float32)
-    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-    embeddings = embeddings / norms
-
-    model = "test-model"
-    insert_embeddings(db_conn, image_ids, embeddings, model)
+def test_search_images_by_text_cosine(db_conn, populated_db):
+    image_ids, embeddings = populated_db(2)
 
     # Search with first embedding
-    results = search_images_by_text(db_conn, embeddings[0:1], model, limit=2)
+    results = search_images_by_text(db_conn, embeddings[0:1], "test-model", limit=2)
     assert len(results) == 2
     top_meta, top_score = results[0]
     assert top_meta.id == image_ids[0]
     assert top_score > 0.99
 
 
-def test_search_images_by_text_with_event_filter(db_conn):
-    insert_image(db_conn, make_metadata("1", event_name="PyCon JP 2024"))
-    insert_image(db_conn, make_metadata("2", event_name="PyCon JP 2023"))
-    image_ids = [row[0] for row in db_conn.execute("SELECT id FROM images ORDER BY id").fetchall()]
-
-    rng = np.random.default_rng(42)
-    embeddings = rng.standard_normal((2, 768)).astype(np.float32)
-    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-    embeddings = embeddings / norms
+def test_search_images_by_text_batch(db_conn, populated_db):
+    image_ids, embeddings = populated_db(2)
+    model = "test-model"
 
+    # Batch of both embeddings: each query's top hit is itself
+    pages = search_images_by_text_batch(db_conn, embeddings, model, limit=2)
+    assert len(pages) == 2
+    for query_idx, page in enumerate(pages):
+        assert len(page) == 2
+        top_meta, top_score = page[0]
+        assert top_meta.id == image_ids[query_idx]
+        assert top_score > 0.99
+
+    # Matches the single-query path
+    single = search_images_by_text(db_conn, embeddings[0:1], model, limit=2)
+    assert [(m.id, round(s, 5)) for m, s in pages[0]] == [(m.id, round(s, 5)) for m, s in single]
+
+
+def test_search_images_by_text_with_event_filter(db_conn, populated_db):
+    _, embeddings = populated_db(
+        2,
+        metas=[
+            make_metadata("1", event_name="PyCon JP 2024"),
+            make_metadata("2", event_name="PyCon JP 2023"),
+        ],
+    )
     model = "test-model"
-    insert_embeddings(db_conn, image_ids, embeddings, model)
 
     # Filter to only "PyCon JP 2024"
     results = search_images_by_text(
@@ -97,18 +106,9 @@ def test_search_images_by_text_with_event_filter(db_conn):
     assert len(results_all) == 2
 
 
-def test_search_images_by_text_offset(db_conn):
-    for i in range(3):
-        insert_image(db_conn, make_metadata(str(i + 1)))
-    image_ids = [row[0] for row in db_conn.execute("SELECT id FROM images ORDER BY id").fetchall()]
-
-    rng = np.random.default_rng(42)
-    embeddings = rng.standard_normal((3, 768)).astype(np.float32)
-    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-    embeddings = embeddings / norms
-
+def test_search_images_by_text_offset(db_conn, populated_db):
+    _, embeddings = populated_db(3)
     model = "test-model"
-    insert_embeddings(db_conn, image_ids, embeddings, model)
 
     # First page
     page1 = search_images_by_text(db_conn, embeddings[0:1], model, limit=2, offset=0)
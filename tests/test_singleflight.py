@@ -0,0 +1,61 @@
+"""Tests for the single-flight call deduplicator."""
+
+import threading
+
+import pytest
+
+from pyconjp_image_search.search.singleflight import SingleFlight
+
+
+def test_sequential_calls_each_execute():
+    flight = SingleFlight()
+    calls = []
+    assert flight.do("k", lambda: calls.append(1) or "a") == "a"
+    assert flight.do("k", lambda: calls.append(1) or "b") == "b"
+    assert len(calls) == 2
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    call_count = 0
+
+    def slow():
+        nonlocal call_count
+        call_count += 1
+        started.set()
+        release.wait(timeout=5)
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    started.wait(timeout=5)
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert results == ["result"] * 4
+    assert call_count == 1
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+
+
+def test_exception_propagates_and_key_is_cleared():
+    flight = SingleFlight()
+
+    def boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        flight.do("k", boom)
+    # The failed flight must not poison later calls for the same key
+    assert flight.do("k", lambda: "ok") == "ok"